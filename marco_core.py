@@ -18,6 +18,7 @@
 
 import socket
 import struct
+import numpy as np
 import pandas as pd
 import csv
 import os
@@ -26,11 +27,12 @@ import time
 import threading
 import queue
 import random
-import re
 import json
 import logging
 import statistics
 import bisect
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Optional imports
@@ -49,9 +51,31 @@ try:
 except ImportError:
     EDGE_TTS_AVAILABLE = False
 
+# Optional: pyarrow CSV reader/writer and Feather reference laps for faster session I/O (pip install pyarrow)
 try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as pa_feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional: numba JIT for the reference-lap braking scan (pip install numba)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import matplotlib
+    # No display server (e.g. SSH/CI on Linux): render straight to PNG with Agg
+    # instead of initialising a GUI backend that can never open a window.
+    if sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+        matplotlib.use('Agg')
     import matplotlib.pyplot as plt
-    import numpy as np
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
     PLOTTING_AVAILABLE = True
 except ImportError:
     PLOTTING_AVAILABLE = False
@@ -61,6 +85,17 @@ except ImportError:
 # =============================================================================
 UDP_IP = "0.0.0.0"
 UDP_PORT = 20777
+UDP_RECV_BUFFER = 1 << 20     # SO_RCVBUF request; absorbs bursts while the coach is busy
+PACKET_QUEUE_SIZE = 256       # receive -> coach hand-off; oldest packet dropped when full
+LOG_QUEUE_SIZE = 4096         # coach -> CSV writer hand-off; oldest row dropped when full
+LOG_BATCH_SIZE = 64           # rows per writerows() call
+LOG_FLUSH_INTERVAL = 1.0      # seconds between CSV flushes
+TELEMETRY_CSV_FIELDS = (
+    'session_time', 'frame_id', 'speed', 'throttle', 'steer', 'brake', 'gear', 'engine_rpm', 'drs',
+    'pos_x', 'pos_y', 'pos_z', 'vel_x', 'vel_y', 'vel_z',
+    'last_lap_time', 'current_lap_time', 'sector1_time', 'sector2_time',
+    'lap_distance', 'current_lap_num', 'sector', 'lap_invalid',
+)
 SESSION_DATA_DIR = "session_data"
 COACH_NAME = "Marco"
 
@@ -227,18 +262,79 @@ def _default_analytics_state():
         'session_report_summary': None,
     }
 
-# Packet formats - F1 25
+# Sample count above which a lap counts as complete for analyze_session(completeness='points')
+COMPLETE_LAP_MIN_POINTS = 3000
+
+# Coaching cooldown categories: index into F1Coach._cd_last / COOLDOWN_DISTANCES
+(CD_BRAKE, CD_BRAKE_WARN, CD_GEAR, CD_THROTTLE, CD_SPEED, CD_POSITIVE,
+ CD_INVALID, CD_DAMAGE, CD_CRASH, CD_CORNER, CD_LAP_SUMMARY) = range(11)
+# Minimum lap distance (m) between two cues of the same category. Plain
+# sequences: these are read one scalar at a time, where ndarray indexing
+# would box a NumPy scalar on every check.
+COOLDOWN_DISTANCES = (120.0, 260.0, 80.0, 150.0, 200.0, 300.0, 300.0, 500.0, 200.0, 200.0, 500.0)
+
+# Live per-lap sample buffer (F1Coach). Packet floats are float32 on the wire,
+# so only the ms-derived lap time needs float64. pos_x/pos_z must stay last.
+LAP_BUFFER_CAPACITY = 8192
+LAP_BUFFER_DTYPES = {
+    'lap_distance': np.float32, 'current_lap_time': np.float64, 'speed': np.float32,
+    'throttle': np.float32, 'brake': np.float32, 'gear': np.int8, 'steer': np.float32,
+    'pos_x': np.float32, 'pos_z': np.float32,
+}
+
+# Telemetry CSV columns used by post-session analysis and plotting
+ANALYSIS_COLUMNS = (
+    'current_lap_num', 'lap_distance', 'current_lap_time', 'last_lap_time',
+    'lap_invalid', 'speed', 'throttle', 'brake', 'gear', 'steer', 'pos_x', 'pos_z',
+)
+
+# Narrow dtypes for loaded telemetry; every value fits (speed <= 400, gear -1..8,
+# lap times < 1 h at ms resolution). Integer columns are only narrowed when the
+# CSV has no gaps, e.g. a truncated last row from an interrupted session.
+TELEMETRY_FLOAT_DTYPES = {
+    'speed': 'float32', 'throttle': 'float32', 'brake': 'float32', 'steer': 'float32',
+    'pos_x': 'float32', 'pos_z': 'float32', 'lap_distance': 'float32',
+    'current_lap_time': 'float32', 'last_lap_time': 'float32',
+}
+TELEMETRY_INT_DTYPES = {'gear': 'int8', 'current_lap_num': 'int16', 'lap_invalid': 'int8'}
+
+# Packet formats - F1 25 (compiled once; unpack_from reads in place, no slicing)
 HEADER_FMT = '<HBBBBBQfIIBB'
-HEADER_SIZE = struct.calcsize(HEADER_FMT)
+HEADER = struct.Struct(HEADER_FMT)
+HEADER_SIZE = HEADER.size
 
 CAR_TELEM_FMT = '<HfffBbHBBHHHHHBBBBBBBBHffffBBBB'
-CAR_TELEM_SIZE = struct.calcsize(CAR_TELEM_FMT)
+CAR_TELEM = struct.Struct(CAR_TELEM_FMT)
+CAR_TELEM_SIZE = CAR_TELEM.size
 
 LAP_DATA_FMT = '<IIHBHBHBHBfffBBBBBBBBBBBBBBHHBfB'
-LAP_DATA_SIZE = struct.calcsize(LAP_DATA_FMT)
+LAP_DATA = struct.Struct(LAP_DATA_FMT)
+LAP_DATA_SIZE = LAP_DATA.size
 
 MOTION_FMT = '<ffffff'
-MOTION_SIZE = struct.calcsize(MOTION_FMT)
+MOTION = struct.Struct(MOTION_FMT)
+MOTION_SIZE = MOTION.size
+
+# Front-left wing, front-right wing, rear wing, floor (offset 20 in each car's damage block)
+CAR_DAMAGE_FMT = '<BBBB'
+CAR_DAMAGE = struct.Struct(CAR_DAMAGE_FMT)
+CAR_DAMAGE_SIZE = CAR_DAMAGE.size
+
+# Event string codes are compared as little-endian u32 values
+EVENT_CODE = struct.Struct('<I')
+EVENT_CODE_SIZE = EVENT_CODE.size
+EVENT_COLL = int.from_bytes(b'COLL', 'little')
+
+# Motion, lap data, event, car telemetry, car damage; every other packet type
+# (session, participants, setups, status, ...) is dropped by the UDP reader
+HANDLED_PACKET_IDS = frozenset((0, 2, 3, 6, 10))
+
+_unpack_header = HEADER.unpack_from
+_unpack_car_telem = CAR_TELEM.unpack_from
+_unpack_lap_data = LAP_DATA.unpack_from
+_unpack_motion = MOTION.unpack_from
+_unpack_car_damage = CAR_DAMAGE.unpack_from
+_unpack_event_code = EVENT_CODE.unpack_from
 
 
 # =============================================================================
@@ -396,18 +492,31 @@ DIALOGUES = {
     'session_end': ["Good session. See you next time.", "Session complete. Nice work."],
 }
 
+# Each category plays through a shuffled round before any phrase repeats;
+# the next round is reshuffled so it never opens with the phrase just said.
+# Single-phrase categories have nothing to rotate; _SAY_TABLE maps them straight
+# to their phrase and every other category to its rotation, so say() needs one
+# dict lookup. Unknown categories are spoken as-is.
+_SAY_RNG = random.Random()
+_SAY_LOCK = threading.Lock()
+_SAY_ROTATION = {k: deque(_SAY_RNG.sample(v, len(v))) for k, v in DIALOGUES.items() if len(v) > 1}
+_SAY_TABLE = {**{k: v[0] for k, v in DIALOGUES.items() if len(v) == 1}, **_SAY_ROTATION}
 _LAST_SAY_BY_CATEGORY = {}
 
 def say(category, **kwargs):
-    phrases = DIALOGUES.get(category, [category])
-    if len(phrases) > 1:
-        last_phrase = _LAST_SAY_BY_CATEGORY.get(category)
-        options = [p for p in phrases if p != last_phrase]
-        phrase = random.choice(options if options else phrases)
+    entry = _SAY_TABLE.get(category, category)
+    if entry.__class__ is str:
+        phrase = entry
     else:
-        phrase = phrases[0]
-    _LAST_SAY_BY_CATEGORY[category] = phrase
-    return phrase.format(**kwargs) if kwargs else phrase
+        with _SAY_LOCK:
+            if not entry:
+                phrases = DIALOGUES[category]
+                entry.extend(_SAY_RNG.sample(phrases, len(phrases)))
+                if len(entry) > 1 and entry[0] == _LAST_SAY_BY_CATEGORY.get(category):
+                    entry.rotate(-1)
+            phrase = entry.popleft()
+            _LAST_SAY_BY_CATEGORY[category] = phrase
+    return phrase.format_map(kwargs) if kwargs else phrase
 
 
 # =============================================================================
@@ -416,42 +525,66 @@ def say(category, **kwargs):
 class SessionManager:
     """Manages session folders and file paths."""
 
+    # Base directories already ensured by an earlier instance; SessionManager is
+    # often constructed inline, so the makedirs syscalls are only paid once.
+    _created_dirs = set()
+
     def __init__(self):
         self.base_dir = SESSION_DATA_DIR
-        os.makedirs(self.base_dir, exist_ok=True)
+        if self.base_dir not in self._created_dirs:
+            try:
+                os.makedirs(self.base_dir)
+            except FileExistsError:
+                pass
+            self._created_dirs.add(self.base_dir)
 
-    def get_existing_sessions(self):
-        """Get list of existing session folders, sorted by number."""
-        if not os.path.exists(self.base_dir):
-            return []
+    # Shared by every SessionManager instance: base_dir -> (st_mtime_ns, candidates,
+    # folders already seen with a telemetry.csv). The directory mtime changes when a
+    # session folder is created or removed, so the listing is only redone then.
+    _scan_cache = {}
 
-        sessions = []
-        for folder in os.listdir(self.base_dir):
-            folder_path = os.path.join(self.base_dir, folder)
-            if os.path.isdir(folder_path) and folder.startswith('session_'):
-                match = re.match(r'session_(\d+)', folder)
-                if match:
-                    num = int(match.group(1))
-                    csv_path = os.path.join(folder_path, 'telemetry.csv')
-                    if os.path.exists(csv_path):
-                        sessions.append({
-                            'number': num,
-                            'folder': folder,
-                            'path': folder_path,
-                            'csv_path': csv_path,
-                        })
+    def _iter_sessions(self):
+        """Yield (number, folder, folder_path, csv_path) for recorded session folders."""
+        try:
+            mtime = os.stat(self.base_dir).st_mtime_ns
+        except FileNotFoundError:
+            return
+        key = os.path.abspath(self.base_dir)
+        cached = self._scan_cache.get(key)
+        if cached is None or cached[0] != mtime:
+            candidates = []
+            with os.scandir(self.base_dir) as it:
+                for entry in it:
+                    # session_<number>_<timestamp>
+                    if not entry.name.startswith('session_'):
+                        continue
+                    num_str = entry.name[8:].partition('_')[0]
+                    if num_str.isdecimal() and entry.is_dir():
+                        candidates.append((int(num_str), entry.name, entry.path,
+                                           os.path.join(entry.path, 'telemetry.csv')))
+            cached = (mtime, candidates, set())
+            self._scan_cache[key] = cached
+
+        # A new session's CSV appears after its folder, so folders without
+        # one are re-checked on every call
+        _, candidates, with_csv = cached
+        for session in candidates:
+            if session[1] in with_csv or os.path.isfile(session[3]):
+                with_csv.add(session[1])
+                yield session
 
+    def get_existing_sessions(self):
+        """Get list of existing session folders, sorted by number."""
+        sessions = [
+            {'number': num, 'folder': folder, 'path': folder_path, 'csv_path': csv_path}
+            for num, folder, folder_path, csv_path in self._iter_sessions()
+        ]
         sessions.sort(key=lambda x: x['number'])
         return sessions
 
     def create_new_session(self):
         """Create a new session folder and return its path."""
-        sessions = self.get_existing_sessions()
-
-        if sessions:
-            next_num = sessions[-1]['number'] + 1
-        else:
-            next_num = 1
+        next_num = max((num for num, *_ in self._iter_sessions()), default=0) + 1
 
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         folder_name = f"session_{next_num:03d}_{timestamp}"
@@ -468,16 +601,53 @@ class SessionManager:
         }
 
     def get_session_info(self, session_path):
-        """Get info about a session from its CSV file."""
+        """Get info about a session from its CSV file.
+
+        The result is cached in session_info.json next to the CSV, tagged with
+        the CSV's size and mtime, so listing old sessions does not re-parse them.
+        """
         csv_path = os.path.join(session_path, 'telemetry.csv')
-        if not os.path.exists(csv_path):
+        try:
+            st = os.stat(csv_path)
+        except OSError:
             return None
+        size_bytes = st.st_size
+        size_kb = size_bytes / 1024
+        # Shorter than the CSV header: the session never logged a sample
+        if size_bytes < 128:
+            return {'points': 0, 'size_kb': size_kb, 'laps': [], 'num_laps': 0}
+
+        cache_path = os.path.join(session_path, 'session_info.json')
+        stamp = [size_bytes, st.st_mtime_ns]
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('csv_stamp') == stamp:
+                return cached['info']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
 
+        info = self._scan_session_csv(csv_path, size_kb)
+        if info is not None:
+            try:
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump({'csv_stamp': stamp, 'info': info}, f)
+            except OSError:
+                pass
+        return info
+
+    @staticmethod
+    def _scan_session_csv(csv_path, size_kb):
         try:
-            df = pd.read_csv(csv_path)
-            size_kb = os.path.getsize(csv_path) / 1024
-            num_points = len(df)
-            laps = sorted(df['current_lap_num'].unique()) if 'current_lap_num' in df.columns else []
+            # Only the lap column is needed; the other columns are never parsed
+            df = _read_telemetry_csv(csv_path, columns=('current_lap_num',))
+            if 'current_lap_num' in df.columns:
+                num_points = len(df)
+                laps = sorted(df['current_lap_num'].unique().tolist())
+            else:
+                with open(csv_path, 'rb') as f:
+                    num_points = max(sum(1 for _ in f) - 1, 0)
+                laps = []
             racing_laps = [l for l in laps if l >= 1]
 
             return {
@@ -493,127 +663,203 @@ class SessionManager:
 # =============================================================================
 # TRACK ANALYZER
 # =============================================================================
+def _sort_by_distance(df):
+    """Rows of a lap ordered by lap_distance, with a fresh RangeIndex.
+
+    Recorded laps are nearly always in distance order already; those are
+    returned as-is instead of copied. Otherwise a stable argsort on the raw
+    column keeps repeated distances in recording order.
+    """
+    dist = df['lap_distance'].to_numpy()
+    if (dist[1:] >= dist[:-1]).all():
+        if isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1:
+            return df
+        return df.reset_index(drop=True)
+    return df.take(np.argsort(dist, kind='stable')).reset_index(drop=True)
+
+
+def _scan_brake_spans(brake, window, enter, exit_):
+    """Single pass over raw brake samples: trailing rolling mean + enter/exit scan.
+
+    Returns (starts, ends) index arrays, ends exclusive. Written in plain
+    loops so it can be compiled by numba; without numba TrackAnalyzer uses
+    the vectorised NumPy path instead.
+    """
+    n = len(brake)
+    starts = np.empty(n // 2 + 1, dtype=np.int64)
+    ends = np.empty(n // 2 + 1, dtype=np.int64)
+    count = 0
+    running = 0.0
+    in_zone = False
+    zone_start = 0
+    for i in range(n):
+        running += brake[i]
+        if i >= window:
+            running -= brake[i - window]
+        smooth = running / min(i + 1, window)
+        if not in_zone and smooth > enter:
+            in_zone = True
+            zone_start = i
+        elif in_zone and smooth < exit_:
+            in_zone = False
+            starts[count] = zone_start
+            ends[count] = i
+            count += 1
+    return starts[:count], ends[:count]
+
+
+if NUMBA_AVAILABLE:
+    _scan_brake_spans = numba.njit(cache=True)(_scan_brake_spans)
+
+
 class TrackAnalyzer:
     """Analyzes reference lap for braking zones and corner data."""
 
+    BRAKE_REACTION_TIME = 0.20  # seconds
+    BRAKE_SAFETY_MARGIN = 10    # metres
+
     def __init__(self, reference_df):
-        self.reference = reference_df.sort_values('lap_distance').reset_index(drop=True)
+        ref = _sort_by_distance(reference_df)
+
+        # Struct-of-arrays copy of the reference lap. Telemetry arrives as
+        # float32/uint8 in the UDP packets, so the narrow dtypes are lossless.
+        self.dist = ref['lap_distance'].to_numpy(np.float32)
+        self.lap_time = ref['current_lap_time'].to_numpy(np.float64)  # ms-derived; keep float64
+        self.speed = ref['speed'].to_numpy(np.float32)
+        self.throttle = ref['throttle'].to_numpy(np.float32)
+        self.brake = ref['brake'].to_numpy(np.float32)
+        self.gear = ref['gear'].to_numpy(np.int8)
+        self.steer = ref['steer'].to_numpy(np.float32) if 'steer' in ref.columns else None
+
+        self._brake_smooth = None  # built on first use; shared by zone and fallback scans
         self.braking_zones = []
         self.corners = []
-        self.track_length = self.reference['lap_distance'].max()
+        self.track_length = float(self.dist.max()) if len(self.dist) else 0.0
+
+        # Nearest-sample lookup: a distance rounds to sample k when it lies at or
+        # below the midpoint between distinct distances k and k+1. Ties resolve
+        # to the first sample with that distance, as idxmin() did.
+        uniq, first = np.unique(self.dist, return_index=True)
+        uniq = uniq.astype(np.float64)
+        self._ref_mids = ((uniq[:-1] + uniq[1:]) * 0.5).tolist()
+        self._ref_first = first.tolist()
         self._analyze()
+        # Sorted zone start distances for get_next_braking_zone
+        self._zone_starts = [z['start_dist'] for z in self.braking_zones]
+        # Per-metre table: _next_zone_lut[m] = number of zones starting at or before m,
+        # i.e. bisect_right(_zone_starts, m) for every whole metre of the lap
+        self._next_zone_lut = np.searchsorted(
+            np.asarray(self._zone_starts, dtype=np.float64), np.arange(int(self.track_length) + 2), side='right',
+        ).tolist()
 
-    def _analyze(self):
-        df = self.reference.copy()
-        df['brake_smooth'] = df['brake'].rolling(window=5, min_periods=1).mean()
-        if 'steer' in df.columns:
-            df['steer_smooth'] = df['steer'].abs().rolling(window=7, min_periods=1).mean()
-        else:
-            df['steer_smooth'] = 0.0
-
-        in_braking = False
-        zone_start = None
-
-        for idx, row in df.iterrows():
-            if row['brake_smooth'] > 0.2 and not in_braking:
-                in_braking = True
-                zone_start = idx
-            elif row['brake_smooth'] < 0.1 and in_braking:
-                in_braking = False
-                if zone_start is not None:
-                    zone_data = df.iloc[zone_start:idx]
-                    if len(zone_data) > 3:
-                        brake_start_dist = zone_data['lap_distance'].iloc[0]
-
-                        min_speed_idx = zone_data['speed'].idxmin()
-                        min_speed_dist = df.loc[min_speed_idx, 'lap_distance']
-                        min_speed_val = zone_data['speed'].min()
-
-                        post_corner = df.iloc[min_speed_idx:min(min_speed_idx + 120, len(df))]
-                        throttle_on_dist = None
-                        for _, r in post_corner.iterrows():
-                            if r['throttle'] > 0.5:
-                                throttle_on_dist = r['lap_distance']
-                                break
-
-                        exit_dist = zone_data['lap_distance'].iloc[-1]
-                        exit_buffer_dist = exit_dist + 50
-
-                        self.braking_zones.append({
-                            'start_dist': brake_start_dist,
-                            'end_dist': exit_dist,
-                            'exit_dist': exit_buffer_dist,
-                            'entry_speed': zone_data['speed'].iloc[0],
-                            'min_speed': min_speed_val,
-                            'min_speed_dist': min_speed_dist,
-                            'min_gear': int(zone_data['gear'].min()),
-                            'brake_start_dist': brake_start_dist,
-                            'throttle_on_dist': throttle_on_dist,
-                        })
-
-        def finalize_steering_corner(start_idx, end_idx):
-            if start_idx is None or end_idx <= start_idx:
-                return None
-            zone_data = df.iloc[start_idx:end_idx]
-            if len(zone_data) < 6:
-                return None
-
-            start_dist = zone_data['lap_distance'].iloc[0]
-            end_dist = zone_data['lap_distance'].iloc[-1]
-            if (end_dist - start_dist) < 20:
-                return None
-
-            min_speed_idx = zone_data['speed'].idxmin()
-            min_speed_dist = df.loc[min_speed_idx, 'lap_distance']
-            min_speed_val = zone_data['speed'].min()
-
-            post_corner = df.iloc[min_speed_idx:min(min_speed_idx + 120, len(df))]
-            throttle_on_dist = None
-            for _, r in post_corner.iterrows():
-                if r['throttle'] > 0.5:
-                    throttle_on_dist = r['lap_distance']
-                    break
+    @staticmethod
+    def _find_spans(enter_mask, exit_mask, close_at_end=False):
+        """Return (start, end) index pairs for an enter/exit hysteresis scan.
+
+        A span opens on a sample where ``enter_mask`` is set and closes
+        (exclusive) on the next sample where ``exit_mask`` is set. Spans
+        still open at the end of the lap are dropped unless ``close_at_end``.
+        """
+        n = len(enter_mask)
+        if n == 0:
+            return []
 
-            brake_dist = None
-            for _, r in zone_data.iterrows():
-                if r['brake'] > 0.2:
-                    brake_dist = r['lap_distance']
-                    break
+        # -1 = hold previous state, 0 = out, 1 = in; forward-fill the holds
+        state = np.full(n, -1, dtype=np.int8)
+        state[exit_mask] = 0
+        state[enter_mask] = 1
+        last_set = np.where(state >= 0, np.arange(n), -1)
+        np.maximum.accumulate(last_set, out=last_set)
+        filled = np.where(last_set >= 0, state[np.maximum(last_set, 0)], 0)
+
+        edges = np.diff(filled, prepend=0)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        if len(starts) > len(ends):
+            if close_at_end:
+                ends = np.append(ends, n)
+            else:
+                starts = starts[:len(ends)]
+        return list(zip(starts.tolist(), ends.tolist()))
+
+    @staticmethod
+    def _rolling_mean(values, window):
+        """Trailing mean over up to ``window`` samples (pandas rolling(window, min_periods=1))."""
+        csum = np.cumsum(values, dtype=np.float64)
+        out = csum.copy()
+        out[window:] -= csum[:-window]
+        out /= np.minimum(np.arange(1, len(out) + 1), window)
+        return out
+
+    @staticmethod
+    def _first_index_above(values, start, stop, threshold):
+        """Index of the first sample in values[start:stop] above threshold, or None."""
+        hits = np.flatnonzero(values[start:stop] > threshold)
+        return start + int(hits[0]) if hits.size else None
+
+    def _brake_spans(self, enter, exit_):
+        """Braking spans on the 5-sample smoothed brake trace."""
+        if NUMBA_AVAILABLE:
+            starts, ends = _scan_brake_spans(self.brake.astype(np.float64), 5, enter, exit_)
+            return list(zip(starts.tolist(), ends.tolist()))
+        if self._brake_smooth is None:
+            self._brake_smooth = self._rolling_mean(self.brake, 5)
+        return self._find_spans(self._brake_smooth > enter, self._brake_smooth < exit_)
+
+    def _span_minima(self, spans):
+        """Min speed and min gear for every [start, end) span in one reduceat pass each."""
+        if not spans:
+            return [], []
+        bounds = np.asarray(spans, dtype=np.intp).ravel()
+        # Pad by one sample so a span ending at the last row is still a valid reduceat index
+        min_speeds = np.minimum.reduceat(np.append(self.speed, 0), bounds)[::2]
+        min_gears = np.minimum.reduceat(np.append(self.gear, 0), bounds)[::2]
+        return min_speeds.tolist(), min_gears.tolist()
 
+    def _analyze(self):
+        n = len(self.dist)
+        distances = self.dist
+        speed = self.speed
+        throttle = self.throttle
+        brake = self.brake
+
+        def throttle_on_after(apex_idx):
+            hit = self._first_index_above(throttle, apex_idx, min(apex_idx + 120, n), 0.5)
+            return float(distances[hit]) if hit is not None else None
+
+        def zone_stats(start_idx, end_idx, exit_buffer, brake_start_dist, min_speed, min_gear):
+            min_speed_idx = start_idx + int(speed[start_idx:end_idx].argmin())
+            end_dist = float(distances[end_idx - 1])
             return {
-                'start_dist': start_dist,
+                'start_dist': float(distances[start_idx]),
                 'end_dist': end_dist,
-                'exit_dist': end_dist + 45,
-                'entry_speed': zone_data['speed'].iloc[0],
-                'min_speed': min_speed_val,
-                'min_speed_dist': min_speed_dist,
-                'min_gear': int(zone_data['gear'].min()),
-                'brake_start_dist': brake_dist,
-                'throttle_on_dist': throttle_on_dist,
+                'exit_dist': end_dist + exit_buffer,
+                'entry_speed': float(speed[start_idx]),
+                'min_speed': float(min_speed),
+                'min_speed_dist': float(distances[min_speed_idx]),
+                'min_gear': int(min_gear),
+                'brake_start_dist': brake_start_dist,
+                'throttle_on_dist': throttle_on_after(min_speed_idx),
             }
 
+        spans = [(zone_start, idx) for zone_start, idx in self._brake_spans(0.2, 0.1) if idx - zone_start > 3]
+        for (zone_start, idx), min_speed, min_gear in zip(spans, *self._span_minima(spans)):
+            self.braking_zones.append(zone_stats(zone_start, idx, 50, float(distances[zone_start]), min_speed, min_gear))
+
         steering_corners = []
-        if 'steer' in df.columns:
-            in_corner = False
-            corner_start = None
+        if self.steer is not None:
             steer_threshold = 0.12
-
-            for idx, row in df.iterrows():
-                steering_active = row['steer_smooth'] > steer_threshold
-                if steering_active and not in_corner:
-                    in_corner = True
-                    corner_start = idx
-                elif not steering_active and in_corner:
-                    in_corner = False
-                    corner = finalize_steering_corner(corner_start, idx)
-                    if corner:
-                        steering_corners.append(corner)
-                    corner_start = None
-
-            if in_corner and corner_start is not None:
-                corner = finalize_steering_corner(corner_start, len(df))
-                if corner:
-                    steering_corners.append(corner)
+            steer_smooth = self._rolling_mean(np.abs(self.steer), 7)
+            steering_active = steer_smooth > steer_threshold
+            spans = [
+                (start_idx, end_idx)
+                for start_idx, end_idx in self._find_spans(steering_active, ~steering_active, close_at_end=True)
+                if end_idx - start_idx >= 6 and (distances[end_idx - 1] - distances[start_idx]) >= 20
+            ]
+            for (start_idx, end_idx), min_speed, min_gear in zip(spans, *self._span_minima(spans)):
+                brake_idx = self._first_index_above(brake, start_idx, end_idx, 0.2)
+                brake_dist = float(distances[brake_idx]) if brake_idx is not None else None
+                steering_corners.append(zone_stats(start_idx, end_idx, 45, brake_dist, min_speed, min_gear))
 
         self.braking_zones.sort(key=lambda z: z['start_dist'])
 
@@ -636,7 +882,7 @@ class TrackAnalyzer:
         self.corners.sort(key=lambda z: z['start_dist'])
 
         if len(self.corners) < 3:
-            fallback_corners = self._build_fallback_corners(df)
+            fallback_corners = self._build_fallback_corners()
             if len(fallback_corners) > len(self.corners):
                 self.corners = fallback_corners
 
@@ -654,14 +900,35 @@ class TrackAnalyzer:
             print(f"    T{z['turn_number']}: {z['start_dist']:.0f}m | {z['entry_speed']:.0f}->{z['min_speed']:.0f} km/h | G{z['min_gear']}")
 
     def get_next_braking_zone(self, current_distance):
-        for zone in self.braking_zones:
-            if zone['start_dist'] > current_distance:
-                return zone
+        lut = self._next_zone_lut
+        if 0 <= current_distance < len(lut):
+            i = lut[int(current_distance)]
+            # Zones starting inside this metre, at or before current_distance
+            starts = self._zone_starts
+            while i < len(starts) and starts[i] <= current_distance:
+                i += 1
+        else:
+            i = bisect.bisect_right(self._zone_starts, current_distance)
+        if i < len(self.braking_zones):
+            return self.braking_zones[i]
         return self.braking_zones[0] if self.braking_zones else None
 
+    def get_reference_index(self, lap_distance):
+        """Index of the reference sample nearest to lap_distance; read the column arrays with it."""
+        # One bisect over the midpoints between distinct distances
+        return self._ref_first[bisect.bisect_left(self._ref_mids, lap_distance)]
+
     def get_reference_at_distance(self, lap_distance):
-        idx = (self.reference['lap_distance'] - lap_distance).abs().idxmin()
-        return self.reference.iloc[idx]
+        """Nearest reference sample as a plain dict (for cold paths; hot paths use the index)."""
+        i = self.get_reference_index(lap_distance)
+        return {
+            'lap_distance': float(self.dist[i]),
+            'current_lap_time': float(self.lap_time[i]),
+            'speed': float(self.speed[i]),
+            'throttle': float(self.throttle[i]),
+            'brake': float(self.brake[i]),
+            'gear': int(self.gear[i]),
+        }
 
     def get_recently_exited_corner(self, current_distance, ignore_turns=None):
         """Return corner data if the car just exited a corner (within 80m past exit)."""
@@ -681,61 +948,54 @@ class TrackAnalyzer:
         if speed_diff <= 0:
             return 0
 
-        reaction_time = 0.20
-        safety_margin = 10
-        reaction_dist = (current_speed / 3.6) * reaction_time
-        speed_factor = speed_diff / 150
-        extra_margin = speed_factor * 20
+        reaction_dist = (current_speed / 3.6) * self.BRAKE_REACTION_TIME
+        extra_margin = (speed_diff / 150) * 20
+        return reaction_dist + self.BRAKE_SAFETY_MARGIN + extra_margin
 
-        return reaction_dist + safety_margin + extra_margin
+    @classmethod
+    def calc_warning_distances(cls, current_speeds, zone_min_speeds):
+        """Vectorised calculate_braking_warning_distance for many speed/zone pairs.
 
-    def _build_fallback_corners(self, df):
+        Zones the car is already at or below the apex speed for get 0, as in
+        the scalar version.
+        """
+        current_speeds = np.asarray(current_speeds, dtype=np.float64)
+        speed_diff = current_speeds - np.asarray(zone_min_speeds, dtype=np.float64)
+        dist = (current_speeds / 3.6) * cls.BRAKE_REACTION_TIME + cls.BRAKE_SAFETY_MARGIN + (speed_diff / 150) * 20
+        return np.where(speed_diff > 0, dist, 0.0)
+
+    def _build_fallback_corners(self):
         """Fallback segmentation using brake spikes when corner extraction is sparse."""
         fallback = []
-        in_zone = False
-        start_idx = None
-
-        for idx, row in df.iterrows():
-            if row['brake_smooth'] > 0.25 and not in_zone:
-                in_zone = True
-                start_idx = idx
-            elif in_zone and row['brake_smooth'] < 0.1:
-                end_idx = idx
-                in_zone = False
-                if start_idx is None or end_idx <= start_idx:
-                    continue
+        distances = self.dist
 
-                zone_data = df.iloc[start_idx:end_idx]
-                if len(zone_data) < 5:
-                    continue
+        spans = [
+            (start_idx, end_idx)
+            for start_idx, end_idx in self._brake_spans(0.25, 0.1)
+            if end_idx - start_idx >= 5 and float(distances[end_idx - 1]) - float(distances[start_idx]) >= 20
+        ]
+        for (start_idx, end_idx), min_speed, min_gear in zip(spans, *self._span_minima(spans)):
+            start_dist = float(distances[start_idx])
+            end_dist = float(distances[end_idx - 1])
 
-                start_dist = float(zone_data['lap_distance'].iloc[0])
-                end_dist = float(zone_data['lap_distance'].iloc[-1])
-                if end_dist - start_dist < 20:
-                    continue
-
-                min_speed_idx = zone_data['speed'].idxmin()
-                apex_dist = float(df.loc[min_speed_idx, 'lap_distance'])
-                min_speed = float(zone_data['speed'].min())
+            min_speed_idx = start_idx + int(self.speed[start_idx:end_idx].argmin())
+            apex_dist = float(distances[min_speed_idx])
+            min_speed = float(min_speed)
 
-                post_corner = df.iloc[min_speed_idx:min(min_speed_idx + 120, len(df))]
-                throttle_on = None
-                for _, sample in post_corner.iterrows():
-                    if sample['throttle'] > 0.5:
-                        throttle_on = float(sample['lap_distance'])
-                        break
+            throttle_idx = self._first_index_above(self.throttle, min_speed_idx, min(min_speed_idx + 120, len(distances)), 0.5)
+            throttle_on = float(distances[throttle_idx]) if throttle_idx is not None else None
 
-                fallback.append({
-                    'start_dist': start_dist,
-                    'end_dist': end_dist,
-                    'exit_dist': end_dist + 45,
-                    'entry_speed': float(zone_data['speed'].iloc[0]),
-                    'min_speed': min_speed,
-                    'min_speed_dist': apex_dist,
-                    'min_gear': int(zone_data['gear'].min()),
-                    'brake_start_dist': start_dist,
-                    'throttle_on_dist': throttle_on,
-                })
+            fallback.append({
+                'start_dist': start_dist,
+                'end_dist': end_dist,
+                'exit_dist': end_dist + 45,
+                'entry_speed': float(self.speed[start_idx]),
+                'min_speed': min_speed,
+                'min_speed_dist': apex_dist,
+                'min_gear': int(min_gear),
+                'brake_start_dist': start_dist,
+                'throttle_on_dist': throttle_on,
+            })
 
         fallback.sort(key=lambda z: z['start_dist'])
         return fallback
@@ -744,52 +1004,85 @@ class TrackAnalyzer:
 # =============================================================================
 # SMART TTS QUEUE
 # =============================================================================
+class _TTSMessage:
+    """Queued utterance; slotted to keep per-message allocations small."""
+    __slots__ = ('message', 'distance', 'valid_range', 'timestamp')
+
+    def __init__(self, message, distance, valid_range, timestamp):
+        self.message = message
+        self.distance = distance
+        self.valid_range = valid_range
+        self.timestamp = timestamp
+
+
 class SmartTTSQueue:
     PRIORITY_CRITICAL = 0
     PRIORITY_HIGH = 1
     PRIORITY_MEDIUM = 2
     PRIORITY_LOW = 3
 
+    # Per-priority lane capacity; a full lane overwrites its oldest entry
+    LANE_CAPACITY = (8, 8, 4, 2)
+
     def __init__(self):
-        self.queue = queue.PriorityQueue()
+        # One producer (coach loop) and one consumer (TTS thread) share fixed-size
+        # FIFO lanes under a single lock; the event wakes the consumer on put().
+        self._lanes = [deque(maxlen=cap) for cap in self.LANE_CAPACITY]
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
         self.current_distance = 0
-        self.message_counter = 0
 
-    def put(self, message, priority=PRIORITY_MEDIUM, valid_range=200):
-        self.message_counter += 1
-        if self.queue.qsize() >= 3 and priority >= self.PRIORITY_MEDIUM:
-            return False
-        self.queue.put((priority, self.message_counter, {
-            'message': message,
-            'distance': self.current_distance,
-            'valid_range': valid_range,
-            'timestamp': time.time(),
-        }))
+    def put(self, message, priority=PRIORITY_MEDIUM, valid_range=200, now=None):
+        """Queue a message; ``now`` is a time.perf_counter() reading the caller already has."""
+        if now is None:
+            now = time.perf_counter()
+        with self._lock:
+            self._lanes[priority].append(_TTSMessage(
+                message, self.current_distance, valid_range, now,
+            ))
+            self._ready.set()
         return True
 
-    def get(self, current_distance, timeout=0.1):
+    @staticmethod
+    def _is_stale(data, current_distance, now):
+        return abs(current_distance - data.distance) > data.valid_range or now - data.timestamp > 3.0
+
+    def get(self, current_distance, timeout=None):
+        """Block until a message is queued (or wake() is called); None if nothing is current."""
         self.current_distance = current_distance
-        while True:
-            try:
-                priority, counter, data = self.queue.get(timeout=timeout)
-            except queue.Empty:
-                return None
+        if not self._ready.wait(timeout):
+            return None
 
-            dist_traveled = abs(current_distance - data['distance'])
-            age = time.time() - data['timestamp']
-            if dist_traveled > data['valid_range'] or age > 3.0:
-                continue
-            return data['message']
+        with self._lock:
+            # Drain stale entries in one locked pass against a single clock read.
+            # The wait may have been long, so judge staleness by the latest distance.
+            current_distance = self.current_distance
+            now = time.perf_counter()
+            message = None
+            for lane in self._lanes:
+                while lane:
+                    data = lane.popleft()
+                    if not self._is_stale(data, current_distance, now):
+                        message = data.message
+                        break
+                if message is not None:
+                    break
+            if not any(self._lanes):
+                self._ready.clear()
+        return message
 
     def update_distance(self, distance):
         self.current_distance = distance
 
+    def wake(self):
+        """Release a consumer blocked in get() without queueing anything."""
+        self._ready.set()
+
     def clear(self):
-        while not self.queue.empty():
-            try:
-                self.queue.get_nowait()
-            except queue.Empty:
-                break
+        with self._lock:
+            for lane in self._lanes:
+                lane.clear()
+            self._ready.clear()
 
 
 # =============================================================================
@@ -807,6 +1100,7 @@ class F1Coach:
         # Telemetry state
         self.current_lap_distance = 0
         self.last_lap_distance = 0
+        self._last_status_bucket = 0  # 200 m bucket of the last status print check
         self.current_speed = 0
         self.current_gear = 0
         self.current_throttle = 0
@@ -815,8 +1109,9 @@ class F1Coach:
         self.current_lap_time = 0
         self.current_delta = 0
 
-        # Position data (for logging)
-        self.position_data = {}
+        # Latest motion packet (for logging); blank CSV cells until the first one
+        self._position_row = ('',) * 6
+        self._has_position = False
 
         # Lap validity tracking
         self.lap_is_invalid = False
@@ -828,17 +1123,16 @@ class F1Coach:
         self.last_penalties = 0
 
         # Damage tracking
-        self.last_fl_wing = 0
-        self.last_fr_wing = 0
-        self.last_rear_wing = 0
-        self.last_floor = 0
+        self._last_damage = (0, 0, 0, 0)  # fl_wing, fr_wing, rear_wing, floor
 
         # Crash detection
         self.last_speed = 0
         self.crash_cooldown = 0
 
-        # Lap tracking
-        self.current_lap_data = []
+        # Lap tracking: current lap samples as preallocated per-column arrays
+        self._lap_buf = {k: np.empty(LAP_BUFFER_CAPACITY, dtype=t) for k, t in LAP_BUFFER_DTYPES.items()}
+        self._lap_idx = 0
+        self._lap_has_position = False
         self.completed_laps = {}
         self.reference = None
         self.reference_lap_num = None
@@ -898,20 +1192,9 @@ class F1Coach:
         self._last_lap_summary_tts = -1
 
         # Cooldowns
-        self.cooldowns = {
-            'brake': {'last_dist': -1000, 'cooldown': 120},
-            'brake_warn': {'last_dist': -1000, 'cooldown': 260},
-            'gear': {'last_dist': -1000, 'cooldown': 80},
-            'throttle': {'last_dist': -1000, 'cooldown': 150},
-            'speed': {'last_dist': -1000, 'cooldown': 200},
-            'positive': {'last_dist': -1000, 'cooldown': 300},
-            'invalid': {'last_dist': -1000, 'cooldown': 300},
-            'damage': {'last_dist': -1000, 'cooldown': 500},
-            'crash': {'last_dist': -1000, 'cooldown': 200},
-            'corner': {'last_dist': -1000, 'cooldown': 200},
-            'lap_summary': {'last_dist': -1000, 'cooldown': 500},
-        }
-        self.last_cue_time = 0
+        self._cd_last = [-1000.0] * len(COOLDOWN_DISTANCES)
+        self._cd_thresh = COOLDOWN_DISTANCES
+        self.last_cue_time = float('-inf')
         self.time_cooldown = 0.8
 
         self.warned_braking_zones = set()
@@ -926,9 +1209,9 @@ class F1Coach:
             self.tts_queue = None
             self.tts_running = False
 
-        # CSV logging
-        self.csv_writer = None
-        self.csv_handle = None
+        # CSV logging (rows are written by _log_worker, started on the first row)
+        self._log_queue = None
+        self._log_thread = None
 
         if self.enable_logging and self.session_info:
             print(f"  Logging to: {self.session_info['csv_path']}")
@@ -939,9 +1222,24 @@ class F1Coach:
         print(f"\n  {COACH_NAME}: Ready. Complete a lap to set baseline.\n")
 
     def _tts_worker(self):
+        # One pyttsx3 engine for the whole session, created on this thread (SAPI
+        # engines are bound to the thread that made them) and only rebuilt
+        # after a failure.
+        engine = None
+        if not (EDGE_TTS_AVAILABLE and MARCO_USE_NEURAL):
+            # SAPI loads voices on the first runAndWait; pay that here with a
+            # silent utterance rather than on the first real callout.
+            try:
+                engine = pyttsx3.init()
+                _configure_tts_engine(engine)
+                engine.say(' ')
+                engine.runAndWait()
+            except Exception as e:
+                print(f"  [TTS Error: {e}]")
+                engine = self._discard_tts_engine(engine)
         while self.tts_running:
             try:
-                message = self.tts_queue.get(self.current_lap_distance, timeout=0.1)
+                message = self.tts_queue.get(self.current_lap_distance)
                 if message is None:
                     continue
 
@@ -950,33 +1248,40 @@ class F1Coach:
                     continue
 
                 # Fall back to pyttsx3 with soothing settings
-                engine = None
                 try:
-                    engine = pyttsx3.init()
-                    _configure_tts_engine(engine)
+                    if engine is None:
+                        engine = pyttsx3.init()
+                        _configure_tts_engine(engine)
                     engine.say(message)
                     engine.runAndWait()
                 except Exception as e:
                     print(f"  [TTS Error: {e}]")
-                finally:
-                    if engine:
-                        try:
-                            engine.stop()
-                            del engine
-                        except Exception:
-                            pass
+                    engine = self._discard_tts_engine(engine)
+            except Exception:
+                pass
+        self._discard_tts_engine(engine)
+
+    @staticmethod
+    def _discard_tts_engine(engine):
+        if engine:
+            try:
+                engine.stop()
             except Exception:
                 pass
+        return None
 
-    def speak(self, message, force=False, priority=SmartTTSQueue.PRIORITY_MEDIUM, valid_range=200):
-        current_time = time.time()
-        if not force and current_time - self.last_cue_time < self.time_cooldown:
+    def speak(self, message, force=False, priority=SmartTTSQueue.PRIORITY_MEDIUM, valid_range=200, now=None):
+        """Queue a cue. Per-sample paths pass update_telemetry's perf_counter() reading
+        as ``now``; packet handlers outside a sample (damage, events) leave it to speak."""
+        if now is None:
+            now = time.perf_counter()
+        if not force and now - self.last_cue_time < self.time_cooldown:
             return False
 
         spoken = False
         if TTS_AVAILABLE and self.tts_queue:
-            if self.tts_queue.put(message, priority, valid_range):
-                self.last_cue_time = current_time
+            if self.tts_queue.put(message, priority, valid_range, now):
+                self.last_cue_time = now
                 print(f"  {COACH_NAME}: {message}")
                 spoken = True
         else:
@@ -986,7 +1291,7 @@ class F1Coach:
         if spoken:
             # Push to speech log for phone display
             log = shared_state['speech_log']
-            log.append({'text': message, 'ts': current_time})
+            log.append({'text': message, 'ts': time.time()})
             # Keep last 50 messages
             if len(log) > 50:
                 shared_state['speech_log'] = log[-50:]
@@ -1000,15 +1305,11 @@ class F1Coach:
             return True
         return False
 
-    def _check_cooldown(self, category):
-        cd = self.cooldowns.get(category)
-        if cd is None:
-            return True
-        return abs(self.current_lap_distance - cd['last_dist']) >= cd['cooldown']
+    def _check_cooldown(self, cat_id):
+        return abs(self.current_lap_distance - self._cd_last[cat_id]) >= self._cd_thresh[cat_id]
 
-    def _set_cooldown(self, category):
-        if category in self.cooldowns:
-            self.cooldowns[category]['last_dist'] = self.current_lap_distance
+    def _set_cooldown(self, cat_id):
+        self._cd_last[cat_id] = self.current_lap_distance
 
     def _format_time_speech(self, time_seconds):
         mins = int(time_seconds // 60)
@@ -1071,7 +1372,7 @@ class F1Coach:
         if df is None or len(df) == 0:
             return None
 
-        work = df.sort_values('lap_distance')
+        work = _sort_by_distance(df)
         distances = work['lap_distance'].tolist()
         times = work['current_lap_time'].tolist()
         if not distances:
@@ -1097,7 +1398,7 @@ class F1Coach:
         if df is None or len(df) == 0 or column not in df.columns:
             return None
 
-        work = df.sort_values('lap_distance')
+        work = _sort_by_distance(df)
         distances = work['lap_distance'].tolist()
         values = work[column].tolist()
         if not distances:
@@ -1123,7 +1424,7 @@ class F1Coach:
         if lap_df is None or len(lap_df) < 5:
             return [], []
 
-        work = lap_df.sort_values('lap_distance').reset_index(drop=True)
+        work = _sort_by_distance(lap_df)
         work = work[work['lap_distance'] >= 0]
         if len(work) < 5:
             return [], []
@@ -1339,7 +1640,7 @@ class F1Coach:
         if self.track_analyzer is None or lap_df is None or len(lap_df) == 0:
             return []
 
-        work = lap_df.sort_values('lap_distance').reset_index(drop=True)
+        work = _sort_by_distance(lap_df)
         if len(work) == 0:
             return []
 
@@ -1693,7 +1994,7 @@ class F1Coach:
         for item in summary:
             print(f"   - T{item['turn']}: +{item['delta']:.3f}s ({item['reason']})")
 
-    def _maybe_speak_time_loss_summary(self, lap_num, summary):
+    def _maybe_speak_time_loss_summary(self, lap_num, summary, now):
         if not summary:
             return
         if lap_num == self._last_lap_summary_tts:
@@ -1701,15 +2002,16 @@ class F1Coach:
         top = summary[0]
         if top['delta'] < 0.12:
             return
-        if not self._check_cooldown('lap_summary'):
+        if not self._check_cooldown(CD_LAP_SUMMARY):
             return
         delta_speech = self._format_delta_speech_simple(top['delta'])
         self.speak(
             say('lap_time_loss_summary', turn=top['turn'], delta=delta_speech),
             priority=SmartTTSQueue.PRIORITY_MEDIUM,
             valid_range=250,
+            now=now,
         )
-        self._set_cooldown('lap_summary')
+        self._set_cooldown(CD_LAP_SUMMARY)
         self._last_lap_summary_tts = lap_num
 
     def _generate_performance_report(self, final=False):
@@ -1879,78 +2181,84 @@ class F1Coach:
 
         return " ".join(sentences[:3])
 
-    def _check_lap_validity(self, is_invalid):
+    def _check_lap_validity(self, is_invalid, now):
+        # Only the valid -> invalid edge does any work
+        if is_invalid == self.lap_is_invalid and (not is_invalid or self.lap_was_invalid):
+            return
         if is_invalid and not self.lap_was_invalid:
             self.lap_is_invalid = True
             self.lap_was_invalid = True
-            if self._check_cooldown('invalid'):
-                self.speak(say('lap_invalidated'), force=True, priority=SmartTTSQueue.PRIORITY_HIGH)
-                self._set_cooldown('invalid')
+            if self._check_cooldown(CD_INVALID):
+                self.speak(say('lap_invalidated'), force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now)
+                self._set_cooldown(CD_INVALID)
         self.lap_is_invalid = is_invalid
 
-    def _check_crash(self):
+    def _check_crash(self, now):
         if self.crash_cooldown > 0:
             self.crash_cooldown -= 1
             return
-        if not self._check_cooldown('crash'):
+        if not self._check_cooldown(CD_CRASH):
             return
 
         speed_drop = self.last_speed - self.current_speed
         if speed_drop > 80 and self.current_brake < 0.3:
-            self.speak(say('crash_heavy'), force=True, priority=SmartTTSQueue.PRIORITY_CRITICAL)
-            self._set_cooldown('crash')
+            self.speak(say('crash_heavy'), force=True, priority=SmartTTSQueue.PRIORITY_CRITICAL, now=now)
+            self._set_cooldown(CD_CRASH)
             self.crash_cooldown = 60
         elif speed_drop > 40 and self.current_brake < 0.3:
-            self.speak(say('crash_light'), priority=SmartTTSQueue.PRIORITY_HIGH)
-            self._set_cooldown('crash')
+            self.speak(say('crash_light'), priority=SmartTTSQueue.PRIORITY_HIGH, now=now)
+            self._set_cooldown(CD_CRASH)
             self.crash_cooldown = 30
 
     def _check_damage(self, fl_wing, fr_wing, rear_wing, floor):
-        if not self._check_cooldown('damage'):
+        if not self._check_cooldown(CD_DAMAGE):
+            return
+
+        # Damage packets mostly repeat the previous values; one tuple compare skips them
+        damage = (fl_wing, fr_wing, rear_wing, floor)
+        if damage == self._last_damage:
             return
+        last_fl, last_fr, last_rear, last_floor = self._last_damage
+        self._last_damage = damage
 
         max_front = max(fl_wing, fr_wing)
-        last_max_front = max(self.last_fl_wing, self.last_fr_wing)
+        last_max_front = max(last_fl, last_fr)
 
         if max_front > last_max_front + 10:
             if max_front > 50:
                 self.speak(say('damage_front_wing_heavy'), force=True, priority=SmartTTSQueue.PRIORITY_HIGH)
             elif max_front > 20:
                 self.speak(say('damage_front_wing_light'), priority=SmartTTSQueue.PRIORITY_MEDIUM)
-            self._set_cooldown('damage')
-        elif rear_wing > self.last_rear_wing + 10:
+            self._set_cooldown(CD_DAMAGE)
+        elif rear_wing > last_rear + 10:
             self.speak(say('damage_rear_wing'), priority=SmartTTSQueue.PRIORITY_HIGH)
-            self._set_cooldown('damage')
-        elif floor > self.last_floor + 15:
+            self._set_cooldown(CD_DAMAGE)
+        elif floor > last_floor + 15:
             self.speak(say('damage_floor'), priority=SmartTTSQueue.PRIORITY_MEDIUM)
-            self._set_cooldown('damage')
-
-        self.last_fl_wing = fl_wing
-        self.last_fr_wing = fr_wing
-        self.last_rear_wing = rear_wing
-        self.last_floor = floor
+            self._set_cooldown(CD_DAMAGE)
 
-    def _check_penalties(self, total_warnings, corner_warnings, penalties):
+    def _check_penalties(self, total_warnings, corner_warnings, penalties, now):
         if corner_warnings > self.last_corner_warnings:
-            self.speak(say('penalty_corner_cutting'), priority=SmartTTSQueue.PRIORITY_MEDIUM)
+            self.speak(say('penalty_corner_cutting'), priority=SmartTTSQueue.PRIORITY_MEDIUM, now=now)
         elif total_warnings > self.last_warnings:
-            self.speak(say('penalty_warning'), priority=SmartTTSQueue.PRIORITY_MEDIUM)
+            self.speak(say('penalty_warning'), priority=SmartTTSQueue.PRIORITY_MEDIUM, now=now)
 
         if penalties > self.last_penalties:
             diff = penalties - self.last_penalties
-            self.speak(say('penalty_time', seconds=diff), force=True, priority=SmartTTSQueue.PRIORITY_HIGH)
+            self.speak(say('penalty_time', seconds=diff), force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now)
 
         self.last_warnings = total_warnings
         self.last_corner_warnings = corner_warnings
         self.last_penalties = penalties
 
     def handle_event(self, event_code):
-        if event_code == b'COLL':
-            if self._check_cooldown('crash'):
+        """Handle an event packet; ``event_code`` is the 4-char code as a u32 (see EVENT_CODE)."""
+        if event_code == EVENT_COLL:
+            if self._check_cooldown(CD_CRASH):
                 self.speak(say('collision_car'), force=True, priority=SmartTTSQueue.PRIORITY_CRITICAL)
-                self._set_cooldown('crash')
+                self._set_cooldown(CD_CRASH)
 
-    def _announce_sector(self, sector_num, sector_time):
+    def _announce_sector(self, sector_num, sector_time, now):
         """Announce sector time with color coding and delta."""
         if sector_time <= 0 or self.lap_is_invalid:
             return
@@ -1968,14 +2276,14 @@ class F1Coach:
             self.best_sector_times[sector_num] = sector_time
             self.speak(
                 say('sector_purple', sector=sector_num, time=time_speech),
-                force=True, priority=SmartTTSQueue.PRIORITY_HIGH
+                force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now
             )
         elif ref is not None and sector_time < ref:
             # Green - faster than reference but not PB
             sector_color = 'green'
             self.speak(
                 say('sector_green', sector=sector_num, time=time_speech),
-                force=True, priority=SmartTTSQueue.PRIORITY_HIGH
+                force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now
             )
         elif ref is not None:
             # Yellow - slower than reference
@@ -1984,13 +2292,13 @@ class F1Coach:
             delta_speech = self._format_delta_speech_simple(delta)
             self.speak(
                 say('sector_yellow', sector=sector_num, delta=delta_speech),
-                force=True, priority=SmartTTSQueue.PRIORITY_HIGH
+                force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now
             )
         else:
             # No reference yet, just announce the time
             self.speak(
                 f"Sector {sector_num}, {time_speech}",
-                force=True, priority=SmartTTSQueue.PRIORITY_HIGH
+                force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now
             )
 
         # Update sector color in shared state for phone
@@ -2009,27 +2317,37 @@ class F1Coach:
         if self.track_analyzer and abs(self.current_delta) > 0.1:
             delta_speech = self._format_delta_speech_simple(self.current_delta)
             if self.current_delta > 0:
-                self.speak(say('delta_plus', delta=delta_speech), priority=SmartTTSQueue.PRIORITY_MEDIUM)
+                self.speak(say('delta_plus', delta=delta_speech), priority=SmartTTSQueue.PRIORITY_MEDIUM, now=now)
             else:
-                self.speak(say('delta_minus', delta=delta_speech), priority=SmartTTSQueue.PRIORITY_MEDIUM)
+                self.speak(say('delta_minus', delta=delta_speech), priority=SmartTTSQueue.PRIORITY_MEDIUM, now=now)
 
-    def _check_sector_change(self, sector, sector1_time, sector2_time):
+    def _check_sector_change(self, sector, sector1_time, sector2_time, now):
         """Announce S1/S2 once per lap as soon as telemetry reports valid split times."""
         if sector != self.last_sector:
             self.last_sector = sector
 
         if not self.sector_announced[1] and sector1_time > 0:
             self.pending_sector1_time = sector1_time
-            self._announce_sector(1, sector1_time)
+            self._announce_sector(1, sector1_time, now)
             self.sector_announced[1] = True
 
         if self.sector_announced[1] and not self.sector_announced[2] and sector2_time > 0:
             self.pending_sector2_time = sector2_time
-            self._announce_sector(2, sector2_time)
+            self._announce_sector(2, sector2_time, now)
             self.sector_announced[2] = True
 
-    def _finish_lap(self, lap_num, lap_time):
-        if not self.current_lap_data or lap_time <= 0:
+    def _grow_lap_buffer(self):
+        self._lap_buf = {k: np.concatenate([v, np.empty_like(v)]) for k, v in self._lap_buf.items()}
+        return self._lap_buf
+
+    def _lap_buffer_frame(self):
+        """Copy the current lap's samples out of the buffer as a DataFrame."""
+        n = self._lap_idx
+        columns = LAP_BUFFER_DTYPES if self._lap_has_position else list(LAP_BUFFER_DTYPES)[:-2]
+        return pd.DataFrame({k: self._lap_buf[k][:n].copy() for k in columns})
+
+    def _finish_lap(self, lap_num, lap_time, now):
+        if not self._lap_idx or lap_time <= 0:
             return
 
         time_speech = self._format_time_speech(lap_time)
@@ -2040,7 +2358,8 @@ class F1Coach:
         self.speak(
             f"Lap {lap_num}, {time_speech}",
             force=True,
-            priority=SmartTTSQueue.PRIORITY_HIGH
+            priority=SmartTTSQueue.PRIORITY_HIGH,
+            now=now,
         )
 
         # S3: just update best/reference tracking silently (lap time callout handles it)
@@ -2087,7 +2406,7 @@ class F1Coach:
             self.lap_was_invalid = False
             return
 
-        lap_df = pd.DataFrame(self.current_lap_data)
+        lap_df = self._lap_buffer_frame()
         self.completed_laps[lap_num] = {'time': lap_time, 'data': lap_df}
 
         is_pb = False
@@ -2117,7 +2436,7 @@ class F1Coach:
 
             # Save reference lap if logging
             if self.enable_logging and self.session_info:
-                self.reference.to_csv(self.session_info['reference_path'], index=False)
+                _write_reference_lap(self.reference, self.session_info['reference_path'])
 
             # Build bin reference (cumulative times at fixed distance bins)
             ref_bins, ref_points = self._build_bin_profile(self.reference)
@@ -2137,21 +2456,21 @@ class F1Coach:
             print(f"{'='*70}\n")
 
             if old_ref is None:
-                self.speak(say('baseline_set', time=time_speech), force=True, priority=SmartTTSQueue.PRIORITY_HIGH)
+                self.speak(say('baseline_set', time=time_speech), force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now)
             else:
                 delta_speech = self._format_delta_speech(old_ref - lap_time)
-                self.speak(say('purple_lap', time=time_speech, delta=delta_speech), force=True, priority=SmartTTSQueue.PRIORITY_HIGH)
+                self.speak(say('purple_lap', time=time_speech, delta=delta_speech), force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now)
         else:
             delta = lap_time - self.reference_lap_time
             delta_speech = self._format_delta_speech(delta)
             print(f"\n  Lap {lap_num}: {mins}:{secs:06.3f} (+{delta:.3f}s)\n")
 
             if delta < 0.5:
-                self.speak(say('lap_close', time=time_speech, delta=delta_speech), force=True, priority=SmartTTSQueue.PRIORITY_HIGH)
+                self.speak(say('lap_close', time=time_speech, delta=delta_speech), force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now)
             elif delta < 2.0:
-                self.speak(say('lap_ok', time=time_speech, delta=delta_speech), force=True, priority=SmartTTSQueue.PRIORITY_HIGH)
+                self.speak(say('lap_ok', time=time_speech, delta=delta_speech), force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now)
             else:
-                self.speak(say('lap_slow', time=time_speech, delta=delta_speech), force=True, priority=SmartTTSQueue.PRIORITY_HIGH)
+                self.speak(say('lap_slow', time=time_speech, delta=delta_speech), force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now)
 
         # Build lap-level TT metrics
         if self.pending_sector1_time > 0:
@@ -2200,7 +2519,7 @@ class F1Coach:
         time_loss_summary = self._build_time_loss_summary(corner_metrics)
         self.last_time_loss_summary = time_loss_summary
         self._print_time_loss_summary(time_loss_summary)
-        self._maybe_speak_time_loss_summary(lap_num, time_loss_summary)
+        self._maybe_speak_time_loss_summary(lap_num, time_loss_summary, now)
 
         # Session mastery + consistency + profile + skills
         self._update_corner_mastery(corner_metrics)
@@ -2253,28 +2572,37 @@ class F1Coach:
             except Exception:
                 pass
 
-    def calculate_delta(self):
+    def calculate_delta(self, ref_idx=None):
         if self.track_analyzer is None or self.current_lap_distance < 100:
             return 0
-        ref = self.track_analyzer.get_reference_at_distance(self.current_lap_distance)
-        return self.current_lap_time - ref['current_lap_time']
+        if ref_idx is None:
+            ref_idx = self.track_analyzer.get_reference_index(self.current_lap_distance)
+        return self.current_lap_time - self.track_analyzer.lap_time[ref_idx]
+
+    def analyze_and_coach(self, now=None):
+        """Delta and real-time callouts for the current sample.
 
-    def analyze_and_coach(self):
+        ``now`` is the sample's time.perf_counter() reading, passed on to speak().
+        """
+        if now is None:
+            now = time.perf_counter()
         if self.track_analyzer is None or self.current_lap_distance < 50:
             return
 
-        self.current_delta = self.calculate_delta()
-        if self.tts_queue:
-            self.tts_queue.update_distance(self.current_lap_distance)
-
-        self._check_braking_zones()
-        self._check_gear()
-        self._check_throttle()
-        self._check_speed()
-        self._check_corners()
+        # One reference lookup per sample, shared by the delta and the checks
+        ref_idx = self.track_analyzer.get_reference_index(self.current_lap_distance)
+        self.current_delta = self.calculate_delta(ref_idx)
+
+        # Every sample: the braking windows are only 25 m wide, so a skipped
+        # sample can cost a callout. Repeats are held back by the cooldowns.
+        self._check_braking_zones(now)
+        self._check_gear(ref_idx, now)
+        self._check_throttle(ref_idx, now)
+        self._check_speed(ref_idx, now)
+        self._check_corners(now)
         # NOTE: _check_delta() removed - delta now announced per sector only
 
-    def _check_braking_zones(self):
+    def _check_braking_zones(self, now):
         next_zone = self.track_analyzer.get_next_braking_zone(self.current_lap_distance)
         if next_zone is None:
             return
@@ -2284,56 +2612,54 @@ class F1Coach:
             distance_to_zone += self.track_analyzer.track_length
 
         warning_dist = self.track_analyzer.calculate_braking_warning_distance(self.current_speed, next_zone)
-        zone_id = f"{next_zone['start_dist']:.0f}"
+        zone_id = int(next_zone['start_dist'])
 
-        if 90 < distance_to_zone < 115 and zone_id not in self.warned_braking_zones and self._check_cooldown('brake_warn'):
+        if 90 < distance_to_zone < 115 and zone_id not in self.warned_braking_zones and self._check_cooldown(CD_BRAKE_WARN):
             # Keep this to big stops only to reduce chatter.
             speed_threshold = max(next_zone['min_speed'] + 75, 170)
             if self.current_speed > speed_threshold:
-                self.speak(say('brake_warning'), priority=SmartTTSQueue.PRIORITY_MEDIUM, valid_range=70)
+                self.speak(say('brake_warning'), priority=SmartTTSQueue.PRIORITY_MEDIUM, valid_range=70, now=now)
                 self.warned_braking_zones.add(zone_id)
-                self._set_cooldown('brake_warn')
+                self._set_cooldown(CD_BRAKE_WARN)
                 return
 
-        if 0 < distance_to_zone < warning_dist and self._check_cooldown('brake'):
+        if 0 < distance_to_zone < warning_dist and self._check_cooldown(CD_BRAKE):
             if self.current_throttle > 0.3 and self.current_brake < 0.2:
                 if next_zone['min_gear'] < self.current_gear - 1:
-                    self.speak(say('brake_with_gear', gear=next_zone['min_gear']), priority=SmartTTSQueue.PRIORITY_CRITICAL, valid_range=60)
+                    self.speak(say('brake_with_gear', gear=next_zone['min_gear']), priority=SmartTTSQueue.PRIORITY_CRITICAL, valid_range=60, now=now)
                 else:
-                    self.speak(say('brake_now'), priority=SmartTTSQueue.PRIORITY_CRITICAL, valid_range=60)
-                self._set_cooldown('brake')
+                    self.speak(say('brake_now'), priority=SmartTTSQueue.PRIORITY_CRITICAL, valid_range=60, now=now)
+                self._set_cooldown(CD_BRAKE)
 
-    def _check_gear(self):
-        if not self._check_cooldown('gear'):
+    def _check_gear(self, ref_idx, now):
+        if not self._check_cooldown(CD_GEAR):
             return
-        ref = self.track_analyzer.get_reference_at_distance(self.current_lap_distance)
-        ref_gear = int(ref['gear'])
+        ref_gear = int(self.track_analyzer.gear[ref_idx])
         if self.current_gear > ref_gear + 1:
-            self.speak(say('downshift', gear=ref_gear), priority=SmartTTSQueue.PRIORITY_HIGH, valid_range=80)
-            self._set_cooldown('gear')
+            self.speak(say('downshift', gear=ref_gear), priority=SmartTTSQueue.PRIORITY_HIGH, valid_range=80, now=now)
+            self._set_cooldown(CD_GEAR)
 
-    def _check_throttle(self):
-        if not self._check_cooldown('throttle'):
+    def _check_throttle(self, ref_idx, now):
+        if not self._check_cooldown(CD_THROTTLE):
             return
-        ref = self.track_analyzer.get_reference_at_distance(self.current_lap_distance)
-        if ref['throttle'] > 0.8 and self.current_throttle < 0.3 and self.current_brake < 0.1:
-            self.speak(say('get_on_power'), priority=SmartTTSQueue.PRIORITY_MEDIUM, valid_range=80)
-            self._set_cooldown('throttle')
+        if self.track_analyzer.throttle[ref_idx] > 0.8 and self.current_throttle < 0.3 and self.current_brake < 0.1:
+            self.speak(say('get_on_power'), priority=SmartTTSQueue.PRIORITY_MEDIUM, valid_range=80, now=now)
+            self._set_cooldown(CD_THROTTLE)
 
-    def _check_speed(self):
-        if not self._check_cooldown('speed'):
+    def _check_speed(self, ref_idx, now):
+        if not self._check_cooldown(CD_SPEED):
             return
-        ref = self.track_analyzer.get_reference_at_distance(self.current_lap_distance)
-        speed_diff = self.current_speed - ref['speed']
+        ref_speed = self.track_analyzer.speed[ref_idx]
+        speed_diff = self.current_speed - ref_speed
 
         if speed_diff < -15 and self.current_speed < 200:
-            self.speak(say('carry_more_speed'), priority=SmartTTSQueue.PRIORITY_LOW, valid_range=120)
-            self._set_cooldown('speed')
-        elif speed_diff > 10 and ref['speed'] < 200 and self._check_cooldown('positive'):
-            self.speak(say('good_speed'), priority=SmartTTSQueue.PRIORITY_LOW, valid_range=80)
-            self._set_cooldown('positive')
+            self.speak(say('carry_more_speed'), priority=SmartTTSQueue.PRIORITY_LOW, valid_range=120, now=now)
+            self._set_cooldown(CD_SPEED)
+        elif speed_diff > 10 and ref_speed < 200 and self._check_cooldown(CD_POSITIVE):
+            self.speak(say('good_speed'), priority=SmartTTSQueue.PRIORITY_LOW, valid_range=80, now=now)
+            self._set_cooldown(CD_POSITIVE)
 
-    def _check_corners(self):
+    def _check_corners(self, now):
         """Corner-by-corner TT feedback with per-corner and per-lap callout caps."""
         if self.track_analyzer is None:
             return
@@ -2401,31 +2727,71 @@ class F1Coach:
 
                 if self.corner_callouts_this_lap >= self.max_corner_callouts_per_lap:
                     continue
-                if not self._check_cooldown('corner'):
+                if not self._check_cooldown(CD_CORNER):
                     continue
 
                 feedback = self._build_corner_callout(turn, corner_data, zone)
                 if feedback:
-                    self.speak(feedback, priority=SmartTTSQueue.PRIORITY_MEDIUM, valid_range=160)
+                    self.speak(feedback, priority=SmartTTSQueue.PRIORITY_MEDIUM, valid_range=160, now=now)
                     self.corner_callouts_this_lap += 1
-                    self._set_cooldown('corner')
+                    self._set_cooldown(CD_CORNER)
 
     def _log_telemetry(self, row):
+        """Hand a TELEMETRY_CSV_FIELDS-ordered row to the CSV writer thread."""
         if not self.enable_logging or not self.session_info:
             return
 
-        if self.csv_writer is None:
-            self.csv_handle = open(self.session_info['csv_path'], 'w', newline='')
-            self.csv_writer = csv.DictWriter(self.csv_handle, fieldnames=row.keys())
-            self.csv_writer.writeheader()
+        log_queue = self._log_queue
+        if log_queue is None:
+            log_queue = self._log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+            self._log_thread = threading.Thread(
+                target=self._log_worker, args=(self.session_info['csv_path'], log_queue), daemon=True,
+            )
+            self._log_thread.start()
 
-        self.csv_writer.writerow(row)
+        # Disk stalls must not back up into the coach loop: drop the oldest row
+        while True:
+            try:
+                log_queue.put_nowait(row)
+                return
+            except queue.Full:
+                try:
+                    log_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    @staticmethod
+    def _log_worker(csv_path, log_queue):
+        """Write queued rows in batches and flush on a timer; a None row ends the file."""
+        with open(csv_path, 'w', newline='') as handle:
+            writer = csv.writer(handle)
+            writer.writerow(TELEMETRY_CSV_FIELDS)
+            last_flush = time.perf_counter()
+            done = False
+            while not done:
+                try:
+                    batch = [log_queue.get(timeout=LOG_FLUSH_INTERVAL)]
+                except queue.Empty:
+                    batch = []
+                while len(batch) < LOG_BATCH_SIZE:
+                    try:
+                        batch.append(log_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if None in batch:
+                    del batch[batch.index(None):]
+                    done = True
+                if batch:
+                    writer.writerows(batch)
+                now = time.perf_counter()
+                if done or now - last_flush >= LOG_FLUSH_INTERVAL:
+                    handle.flush()
+                    last_flush = now
 
     def update_position(self, pos_x, pos_y, pos_z, vel_x, vel_y, vel_z):
-        self.position_data = {
-            'pos_x': pos_x, 'pos_y': pos_y, 'pos_z': pos_z,
-            'vel_x': vel_x, 'vel_y': vel_y, 'vel_z': vel_z,
-        }
+        # Kept in TELEMETRY_CSV_FIELDS order so the log row can splat it directly
+        self._position_row = (pos_x, pos_y, pos_z, vel_x, vel_y, vel_z)
+        self._has_position = True
         # Update shared state for web interface
         shared_state['position'] = {'x': pos_x, 'z': pos_z}
 
@@ -2444,14 +2810,22 @@ class F1Coach:
                          lap_distance, lap_num, current_lap_time, last_lap_time,
                          sector, sector1_time, sector2_time, session_time, frame_id,
                          lap_invalid=0, total_warnings=0, corner_warnings=0, penalties=0):
+        now = time.perf_counter()
+
+        # The TTS worker blocks in get() between cues, so this is the only place
+        # the queue learns the car's position. Done first so that cues queued
+        # at a lap change are stamped with the new lap's distance.
+        if self.tts_queue:
+            self.tts_queue.update_distance(lap_distance)
 
         # New lap detection
         if lap_num != self.current_lap_num:
             if self.current_lap_num > 0 and last_lap_time > 0:
-                self._finish_lap(self.current_lap_num, last_lap_time)
+                self._finish_lap(self.current_lap_num, last_lap_time, now)
 
             self.current_lap_num = lap_num
-            self.current_lap_data = []
+            self._lap_idx = 0
+            self._lap_has_position = False
             self.warned_braking_zones.clear()
             self.lap_is_invalid = False
             self.lap_was_invalid = False
@@ -2468,19 +2842,18 @@ class F1Coach:
             self.last_live_bin_index = None
             shared_state['sector_colors'] = {1: None, 2: None, 3: None}
 
-            for cd in self.cooldowns.values():
-                cd['last_dist'] = -1000
+            self._cd_last[:] = [-1000.0] * len(COOLDOWN_DISTANCES)
             if self.tts_queue:
                 self.tts_queue.clear()
 
             if lap_num == 0:
-                self.speak(say('formation_lap'), force=True, priority=SmartTTSQueue.PRIORITY_HIGH)
+                self.speak(say('formation_lap'), force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now)
             elif lap_num >= 1:
                 if self.reference is None:
-                    self.speak(say('lap_start_no_ref', lap=lap_num), force=True, priority=SmartTTSQueue.PRIORITY_HIGH)
+                    self.speak(say('lap_start_no_ref', lap=lap_num), force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now)
                 else:
                     target = self._format_time_speech(self.reference_lap_time)
-                    self.speak(say('lap_start_with_ref', lap=lap_num, target=target), force=True, priority=SmartTTSQueue.PRIORITY_HIGH)
+                    self.speak(say('lap_start_with_ref', lap=lap_num, target=target), force=True, priority=SmartTTSQueue.PRIORITY_HIGH, now=now)
 
         self.last_speed = self.current_speed
         self.last_lap_distance = self.current_lap_distance
@@ -2493,54 +2866,45 @@ class F1Coach:
         self.current_sector = sector
 
         # Sector change detection (Part 1 & 2)
-        self._check_sector_change(sector, sector1_time, sector2_time)
+        self._check_sector_change(sector, sector1_time, sector2_time, now)
 
-        self._check_lap_validity(lap_invalid == 1)
-        self._check_penalties(total_warnings, corner_warnings, penalties)
-        self._check_crash()
+        self._check_lap_validity(lap_invalid == 1, now)
+        self._check_penalties(total_warnings, corner_warnings, penalties, now)
+        self._check_crash(now)
 
         # Record sample
         if lap_num > 0:
-            sample = {
-                'lap_distance': lap_distance,
-                'current_lap_time': current_lap_time,
-                'speed': speed,
-                'throttle': throttle,
-                'brake': brake,
-                'gear': gear,
-                'steer': steer,
-            }
+            i = self._lap_idx
+            buf = self._lap_buf
+            if i == len(buf['speed']):
+                buf = self._grow_lap_buffer()
+            buf['lap_distance'][i] = lap_distance
+            buf['current_lap_time'][i] = current_lap_time
+            buf['speed'][i] = speed
+            buf['throttle'][i] = throttle
+            buf['brake'][i] = brake
+            buf['gear'][i] = gear
+            buf['steer'][i] = steer
             # Include position data if available
-            if self.position_data:
-                sample['pos_x'] = self.position_data.get('pos_x', 0)
-                sample['pos_z'] = self.position_data.get('pos_z', 0)
-            self.current_lap_data.append(sample)
+            if self._has_position:
+                buf['pos_x'][i] = self._position_row[0]
+                buf['pos_z'][i] = self._position_row[2]
+                self._lap_has_position = True
+            else:
+                buf['pos_x'][i] = np.nan
+                buf['pos_z'][i] = np.nan
+            self._lap_idx = i + 1
 
         # Log to CSV
         if self.enable_logging:
-            row = {
-                'session_time': session_time,
-                'frame_id': frame_id,
-                'speed': speed,
-                'throttle': throttle,
-                'steer': steer,
-                'brake': brake,
-                'gear': gear,
-                'engine_rpm': engine_rpm,
-                'drs': drs,
-                **self.position_data,
-                'last_lap_time': last_lap_time,
-                'current_lap_time': current_lap_time,
-                'sector1_time': sector1_time,
-                'sector2_time': sector2_time,
-                'lap_distance': lap_distance,
-                'current_lap_num': lap_num,
-                'sector': sector,
-                'lap_invalid': lap_invalid,
-            }
-            self._log_telemetry(row)
-
-        self.analyze_and_coach()
+            self._log_telemetry((
+                session_time, frame_id, speed, throttle, steer, brake, gear, engine_rpm, drs,
+                *self._position_row,
+                last_lap_time, current_lap_time, sector1_time, sector2_time,
+                lap_distance, lap_num, sector, lap_invalid,
+            ))
+
+        self.analyze_and_coach(now)
         self._update_live_bin_deltas()
         self._sync_shared_performance_state()
 
@@ -2553,7 +2917,9 @@ class F1Coach:
         shared_state['current_sector'] = sector
 
         # Status print every 200m
-        if int(self.current_lap_distance / 200) != int(self.last_lap_distance / 200):
+        bucket = int(lap_distance) // 200
+        if bucket != self._last_status_bucket:
+            self._last_status_bucket = bucket
             invalid_str = " [INVALID]" if self.lap_is_invalid else ""
             delta_str = f" | ÃŽâ€: {self.current_delta:+.2f}s" if self.track_analyzer else ""
             label = "Out" if lap_num == 0 else f"L{lap_num}"
@@ -2564,16 +2930,62 @@ class F1Coach:
 
     def shutdown(self):
         self.tts_running = False
+        if self.tts_queue:
+            self.tts_queue.wake()
         if hasattr(self, 'tts_thread') and self.tts_thread.is_alive():
             self.tts_thread.join(timeout=2)
-        if self.csv_handle:
-            self.csv_handle.close()
+        if self._log_thread is not None:
+            if self._log_thread.is_alive():
+                self._log_queue.put(None)
+                self._log_thread.join(timeout=5)
             print(f"  Telemetry saved to: {self.session_info['csv_path']}")
 
 
 # =============================================================================
 # UDP RECEIVER
 # =============================================================================
+def _udp_reader(sock, packet_queue, stop_event):
+    """Receive packets on a dedicated thread so coach work never stalls the socket.
+
+    Each datagram's header is decoded here and, for packet types the coach
+    uses, ``(header, data)`` is queued for the session loop. When the queue is
+    full the oldest packet is dropped: a stale frame is worth less than the
+    newest one.
+    """
+    buf = bytearray(4096)
+    view = memoryview(buf)
+    unpack_header = _unpack_header
+    handled = HANDLED_PACKET_IDS
+    # recv_into: the sender address is never used, so skip the (n, addr) tuple
+    recv_into = sock.recv_into
+    put_nowait = packet_queue.put_nowait
+    get_nowait = packet_queue.get_nowait
+
+    while not stop_event.is_set():
+        try:
+            n = recv_into(buf)
+        except socket.timeout:
+            continue
+        except OSError:
+            break
+        if n < HEADER_SIZE:
+            continue
+        header = unpack_header(buf, 0)
+        if header[5] not in handled:
+            continue
+
+        item = (header, bytes(view[:n]))
+        while True:
+            try:
+                put_nowait(item)
+                break
+            except queue.Full:
+                try:
+                    get_nowait()
+                except queue.Empty:
+                    pass
+
+
 def run_coaching_session(enable_logging=False):
     """Run a live coaching session."""
     session_mgr = SessionManager()
@@ -2597,9 +3009,18 @@ def run_coaching_session(enable_logging=False):
             break
 
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RECV_BUFFER)
+    except OSError:
+        pass
     sock.bind((UDP_IP, UDP_PORT))
     sock.settimeout(1.0)
 
+    packet_queue = queue.Queue(maxsize=PACKET_QUEUE_SIZE)
+    reader_stop = threading.Event()
+    reader = threading.Thread(target=_udp_reader, args=(sock, packet_queue, reader_stop), daemon=True)
+    reader.start()
+
     print(f"\n  Listening on {UDP_IP}:{UDP_PORT}")
     print("  Waiting for F1 25 telemetry...")
     print("  Press Ctrl+C to stop\n")
@@ -2607,10 +3028,17 @@ def run_coaching_session(enable_logging=False):
     packet_count = 0
     last_lap_distance = None
     crossed_start_finish = False
-    lap_data = {}
+    have_lap_data = False
     session_time = 0
     frame_id = 0
 
+    # Precompiled Struct unpackers bound as locals for the per-packet loop
+    unpack_motion = _unpack_motion
+    unpack_lap_data = _unpack_lap_data
+    unpack_car_telem = _unpack_car_telem
+    unpack_car_damage = _unpack_car_damage
+    unpack_event_code = _unpack_event_code
+
     try:
         while True:
             # Check for stop command from phone
@@ -2622,118 +3050,107 @@ def run_coaching_session(enable_logging=False):
                 pass
 
             try:
-                data, addr = sock.recvfrom(4096)
-                packet_count += 1
-
-                if len(data) >= HEADER_SIZE:
-                    header = struct.unpack(HEADER_FMT, data[:HEADER_SIZE])
-                    packet_id = header[5]
-                    session_time = header[7]
-                    frame_id = header[8]
-                    player_car_index = header[10]
-
-                    # Motion packet (ID 0)
-                    if packet_id == 0:
-                        offset = HEADER_SIZE + (player_car_index * 60)
-                        if len(data) >= offset + 24:
-                            motion = struct.unpack('<ffffff', data[offset:offset+24])
-                            coach.update_position(*motion)
-
-                    # Lap data packet (ID 2)
-                    elif packet_id == 2:
-                        offset = HEADER_SIZE + (player_car_index * LAP_DATA_SIZE)
-                        if len(data) >= offset + LAP_DATA_SIZE:
-                            lap = struct.unpack(LAP_DATA_FMT, data[offset:offset + LAP_DATA_SIZE])
-
-                            lap_distance = lap[10]
-                            raw_lap_num = int(lap[14])
-                            lap_invalid = lap[18]
-                            penalties = lap[19]
-                            total_warnings = lap[20]
-                            corner_warnings = lap[21]
-
-                            if last_lap_distance is not None and last_lap_distance < 0 and lap_distance >= 0:
-                                if not crossed_start_finish:
-                                    crossed_start_finish = True
-                                    print(f"\n  >>> START/FINISH - LAP 1 <<<\n")
-
-                            current_lap_num = 0 if not crossed_start_finish else raw_lap_num
-                            last_lap_distance = lap_distance
-
-                            lap_data = {
-                                'lap_distance': lap_distance,
-                                'current_lap_num': current_lap_num,
-                                'current_lap_time': lap[1] / 1000.0,
-                                'last_lap_time': lap[0] / 1000.0,
-                                'sector1_time': (lap[3] * 60.0) + (lap[2] / 1000.0),
-                                'sector2_time': (lap[5] * 60.0) + (lap[4] / 1000.0),
-                                'sector': lap[17],
-                                'lap_invalid': lap_invalid,
-                                'total_warnings': total_warnings,
-                                'corner_warnings': corner_warnings,
-                                'penalties': penalties,
-                            }
-
-                    # Event packet (ID 3)
-                    elif packet_id == 3:
-                        if len(data) >= HEADER_SIZE + 4:
-                            event_code = data[HEADER_SIZE:HEADER_SIZE + 4]
-                            coach.handle_event(event_code)
-
-                    # Car telemetry packet (ID 6)
-                    elif packet_id == 6:
-                        offset = HEADER_SIZE + (player_car_index * CAR_TELEM_SIZE)
-                        if len(data) >= offset + CAR_TELEM_SIZE:
-                            car = struct.unpack(CAR_TELEM_FMT, data[offset:offset + CAR_TELEM_SIZE])
-
-                            if lap_data:
-                                coach.update_telemetry(
-                                    speed=car[0],
-                                    throttle=car[1],
-                                    brake=car[3],
-                                    gear=car[5],
-                                    steer=car[2],
-                                    engine_rpm=car[6],
-                                    drs=car[7],
-                                    lap_distance=lap_data['lap_distance'],
-                                    lap_num=lap_data['current_lap_num'],
-                                    current_lap_time=lap_data['current_lap_time'],
-                                    last_lap_time=lap_data['last_lap_time'],
-                                    sector=lap_data['sector'],
-                                    sector1_time=lap_data['sector1_time'],
-                                    sector2_time=lap_data['sector2_time'],
-                                    session_time=session_time,
-                                    frame_id=frame_id,
-                                    lap_invalid=lap_data.get('lap_invalid', 0),
-                                    total_warnings=lap_data.get('total_warnings', 0),
-                                    corner_warnings=lap_data.get('corner_warnings', 0),
-                                    penalties=lap_data.get('penalties', 0),
-                                )
-
-                    # Car damage packet (ID 10)
-                    elif packet_id == 10:
-                        damage_per_car = 42
-                        offset = HEADER_SIZE + (player_car_index * damage_per_car)
-                        damage_offset = offset + 20
-
-                        if len(data) >= damage_offset + 4:
-                            damage_data = struct.unpack('<BBBB', data[damage_offset:damage_offset + 4])
-                            coach.update_damage(
-                                fl_wing=damage_data[0],
-                                fr_wing=damage_data[1],
-                                rear_wing=damage_data[2],
-                                floor=damage_data[3],
-                            )
-
-                # Flush CSV periodically
-                if enable_logging and coach.csv_handle and packet_count % 100 == 0:
-                    coach.csv_handle.flush()
-
-            except socket.timeout:
-                pass
+                header, data = packet_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+
+            packet_count += 1
+            packet_id = header[5]
+            session_time = header[7]
+            frame_id = header[8]
+            player_car_index = header[10]
+
+            # Motion packet (ID 0)
+            if packet_id == 0:
+                offset = HEADER_SIZE + (player_car_index * 60)
+                if len(data) >= offset + MOTION_SIZE:
+                    motion = unpack_motion(data, offset)
+                    coach.update_position(*motion)
+
+            # Lap data packet (ID 2)
+            elif packet_id == 2:
+                offset = HEADER_SIZE + (player_car_index * LAP_DATA_SIZE)
+                if len(data) >= offset + LAP_DATA_SIZE:
+                    lap = unpack_lap_data(data, offset)
+
+                    lap_distance = lap[10]
+                    raw_lap_num = int(lap[14])
+
+                    if last_lap_distance is not None and last_lap_distance < 0 and lap_distance >= 0:
+                        if not crossed_start_finish:
+                            crossed_start_finish = True
+                            print(f"\n  >>> START/FINISH - LAP 1 <<<\n")
+
+                    # Latest lap state, held in locals until the next car telemetry packet
+                    current_lap_num = 0 if not crossed_start_finish else raw_lap_num
+                    last_lap_distance = lap_distance
+                    current_lap_time = lap[1] / 1000.0
+                    last_lap_time = lap[0] / 1000.0
+                    sector1_time = (lap[3] * 60.0) + (lap[2] / 1000.0)
+                    sector2_time = (lap[5] * 60.0) + (lap[4] / 1000.0)
+                    sector = lap[17]
+                    lap_invalid = lap[18]
+                    penalties = lap[19]
+                    total_warnings = lap[20]
+                    corner_warnings = lap[21]
+                    have_lap_data = True
+
+            # Event packet (ID 3)
+            elif packet_id == 3:
+                if len(data) >= HEADER_SIZE + EVENT_CODE_SIZE:
+                    coach.handle_event(unpack_event_code(data, HEADER_SIZE)[0])
+
+            # Car telemetry packet (ID 6)
+            elif packet_id == 6:
+                # Nothing to pair the sample with until a lap packet has arrived
+                if not have_lap_data:
+                    continue
+                offset = HEADER_SIZE + (player_car_index * CAR_TELEM_SIZE)
+                if len(data) >= offset + CAR_TELEM_SIZE:
+                    car = unpack_car_telem(data, offset)
+                    coach.update_telemetry(
+                        speed=car[0],
+                        throttle=car[1],
+                        brake=car[3],
+                        gear=car[5],
+                        steer=car[2],
+                        engine_rpm=car[6],
+                        drs=car[7],
+                        lap_distance=lap_distance,
+                        lap_num=current_lap_num,
+                        current_lap_time=current_lap_time,
+                        last_lap_time=last_lap_time,
+                        sector=sector,
+                        sector1_time=sector1_time,
+                        sector2_time=sector2_time,
+                        session_time=session_time,
+                        frame_id=frame_id,
+                        lap_invalid=lap_invalid,
+                        total_warnings=total_warnings,
+                        corner_warnings=corner_warnings,
+                        penalties=penalties,
+                    )
+
+            # Car damage packet (ID 10)
+            elif packet_id == 10:
+                damage_per_car = 42
+                offset = HEADER_SIZE + (player_car_index * damage_per_car)
+                damage_offset = offset + 20
+
+                if len(data) >= damage_offset + CAR_DAMAGE_SIZE:
+                    damage_data = unpack_car_damage(data, damage_offset)
+                    coach.update_damage(
+                        fl_wing=damage_data[0],
+                        fr_wing=damage_data[1],
+                        rear_wing=damage_data[2],
+                        floor=damage_data[3],
+                    )
 
     except KeyboardInterrupt:
         pass
+    finally:
+        reader_stop.set()
+        reader.join(timeout=2)
 
     print(f"\n\n{'='*70}")
     print(f"  {COACH_NAME}: {say('session_end')}")
@@ -2778,19 +3195,158 @@ def run_coaching_session(enable_logging=False):
 # =============================================================================
 # SESSION ANALYSIS
 # =============================================================================
-def analyze_session(session_path):
-    """Analyze a recorded session."""
+def _read_telemetry_csv(csv_path, columns=None):
+    """Load a telemetry CSV, keeping only the given columns that exist in it."""
+    usecols = None
+    if columns is not None:
+        with open(csv_path, 'r', newline='') as f:
+            header = next(csv.reader(f), [])
+        usecols = [c for c in header if c in columns]
+
+    df = None
+    if PYARROW_AVAILABLE:
+        try:
+            df = pd.read_csv(csv_path, usecols=usecols, engine='pyarrow', dtype=TELEMETRY_FLOAT_DTYPES)
+        except ValueError:
+            pass  # e.g. truncated last row from an interrupted session
+    if df is None:
+        df = pd.read_csv(csv_path, usecols=usecols, dtype=TELEMETRY_FLOAT_DTYPES)
+
+    narrow = {c: t for c, t in TELEMETRY_INT_DTYPES.items()
+              if c in df.columns and not df[c].isna().any()}
+    return df.astype(narrow) if narrow else df
+
+
+# Background read of the session the user is most likely to pick, started while
+# select_session waits on input: csv_path -> ((st_size, st_mtime_ns), Future)
+_analysis_prefetch = {}
+_prefetch_executor = None
+
+
+def _prefetch_analysis_frame(csv_path):
+    """Start loading a session's analysis columns in the background."""
+    global _prefetch_executor
+    try:
+        st = os.stat(csv_path)
+    except OSError:
+        return
+    if _prefetch_executor is None:
+        _prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='marco-prefetch')
+    _analysis_prefetch.clear()
+    _analysis_prefetch[csv_path] = (
+        (st.st_size, st.st_mtime_ns),
+        _prefetch_executor.submit(_read_telemetry_csv, csv_path, ANALYSIS_COLUMNS),
+    )
+
+
+def _load_analysis_frame(csv_path):
+    """Analysis columns of a session CSV, reusing a prefetch if the file is unchanged."""
+    pending = _analysis_prefetch.pop(csv_path, None)
+    _analysis_prefetch.clear()
+    if pending is not None:
+        stamp, future = pending
+        try:
+            st = os.stat(csv_path)
+            if (st.st_size, st.st_mtime_ns) == stamp:
+                return future.result()
+        except Exception:
+            pass  # fall through to a fresh read, which reports real errors
+    return _read_telemetry_csv(csv_path, ANALYSIS_COLUMNS)
+
+
+def _read_lap_rows(csv_path, rows, lap_num):
+    """Every column of one lap from a telemetry CSV, at the file's own precision.
+
+    ``rows`` are the lap's 0-based data-row positions (the index of a frame
+    from _read_telemetry_csv); only the span between the first and last of
+    them is parsed. Falls back to a full read if the span does not line up.
+    """
+    first, last = int(rows.min()), int(rows.max())
+    try:
+        span = pd.read_csv(csv_path, skiprows=range(1, first + 1), nrows=last - first + 1)
+        lap = span[span['current_lap_num'] == lap_num]
+        if len(lap) == len(rows):
+            return lap
+    except (ValueError, KeyError, pd.errors.ParserError):
+        pass
+    df = pd.read_csv(csv_path)
+    return df[df['current_lap_num'] == lap_num]
+
+
+def _write_csv(df, csv_path):
+    """Write a DataFrame as CSV, using pyarrow's native writer when installed.
+
+    The header line is written here so it stays unquoted, as DataFrame.to_csv writes it.
+    """
+    if PYARROW_AVAILABLE:
+        with open(csv_path, 'wb') as f:
+            f.write((','.join(map(str, df.columns)) + '\n').encode('utf-8'))
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), f,
+                             pa_csv.WriteOptions(include_header=False))
+    else:
+        df.to_csv(csv_path, index=False)
+
+
+def _write_reference_lap(df, csv_path, csv_df=None):
+    """Save a reference lap as CSV, plus an uncompressed Feather copy when pyarrow is installed.
+
+    The Feather file sits next to the CSV (same name, .feather) and lets
+    read_reference_lap memory-map the lap instead of parsing text. ``csv_df``
+    is written to the CSV instead of ``df`` when given, e.g. the full-width
+    logged rows behind a narrowed analysis frame.
+    """
+    _write_csv(df if csv_df is None else csv_df, csv_path)
+    if PYARROW_AVAILABLE:
+        try:
+            pa_feather.write_feather(df.reset_index(drop=True), os.path.splitext(csv_path)[0] + '.feather',
+                                     compression='uncompressed')
+        except OSError:
+            pass  # e.g. the old copy is still mapped by a reader (Windows); the CSV is authoritative
+
+
+def read_reference_lap(csv_path):
+    """Load a reference lap, memory-mapping its Feather copy when it is current."""
+    feather_path = os.path.splitext(csv_path)[0] + '.feather'
+    if PYARROW_AVAILABLE and os.path.exists(feather_path):
+        try:
+            if os.path.getmtime(feather_path) >= os.path.getmtime(csv_path):
+                with pa.memory_map(feather_path, 'r') as src:
+                    table = pa.ipc.open_file(src).read_all()
+                # split_blocks keeps numeric columns as views onto the mapped file
+                return table.to_pandas(split_blocks=True)
+        except (OSError, pa.ArrowInvalid):
+            pass
+    return pd.read_csv(csv_path)
+
+
+def analyze_session(session_path, completeness='nextlap'):
+    """Analyze a recorded session.
+
+    completeness picks how a lap counts as complete: 'nextlap' (default) when
+    the following lap reports a last_lap_time, 'points' when the lap has more
+    than COMPLETE_LAP_MIN_POINTS samples (older logs without lap times).
+    """
     csv_path = os.path.join(session_path, 'telemetry.csv')
 
     print(f"\n  Loading: {csv_path}")
-    df = pd.read_csv(csv_path)
+    df = _load_analysis_frame(csv_path)
     print(f"  Loaded {len(df):,} telemetry points\n")
 
-    all_laps = sorted(df['current_lap_num'].unique())
+    # One pass over the session: per-lap aggregates instead of a boolean
+    # mask scan of the whole frame for every lap.
+    grouped = df.groupby('current_lap_num', sort=True)
+    lap_points = grouped.size()
+    lap_max_speed = grouped['speed'].max()
+    lap_avg_speed = grouped['speed'].mean()
+    lap_max_time = grouped['current_lap_time'].max()
+    lap_first_last_time = grouped['last_lap_time'].first()
+    lap_invalid_max = grouped['lap_invalid'].max() if 'lap_invalid' in df.columns else None
+
+    all_laps = list(lap_points.index)
     racing_laps = [l for l in all_laps if l >= 1]
 
     if 0 in all_laps:
-        pts = len(df[df['current_lap_num'] == 0])
+        pts = int(lap_points.loc[0])
         print(f"  Formation lap (Lap 0): {pts} points - skipping\n")
 
     if not racing_laps:
@@ -2802,41 +3358,48 @@ def analyze_session(session_path):
     print("=" * 70)
 
     lap_info = []
+    lap_lines = []
 
     for lap_num in racing_laps:
-        lap_df = df[df['current_lap_num'] == lap_num]
+        lap_num = int(lap_num)
+        points = int(lap_points.loc[lap_num])
 
-        next_lap_df = df[df['current_lap_num'] == lap_num + 1]
-        if len(next_lap_df) > 0:
-            lap_time = next_lap_df['last_lap_time'].iloc[0]
+        # The lap time is reported as last_lap_time on the first sample of the next lap
+        if (lap_num + 1) in lap_first_last_time.index:
+            lap_time = lap_first_last_time.loc[lap_num + 1]
             is_complete = lap_time > 0
         else:
-            lap_time = lap_df['current_lap_time'].max() if len(lap_df) > 0 else 0
+            lap_time = lap_max_time.loc[lap_num]
             is_complete = False
+        if completeness == 'points':
+            is_complete = points > COMPLETE_LAP_MIN_POINTS
 
         was_invalid = False
-        if 'lap_invalid' in lap_df.columns:
-            was_invalid = lap_df['lap_invalid'].max() > 0
+        if lap_invalid_max is not None:
+            was_invalid = lap_invalid_max.loc[lap_num] > 0
 
-        max_speed = lap_df['speed'].max()
-        avg_speed = lap_df['speed'].mean()
+        max_speed = lap_max_speed.loc[lap_num]
+        avg_speed = lap_avg_speed.loc[lap_num]
 
         lap_info.append({
             'lap_num': lap_num,
-            'points': len(lap_df),
-            'lap_time': lap_time,
-            'max_speed': max_speed,
-            'avg_speed': avg_speed,
-            'is_complete': is_complete,
-            'was_invalid': was_invalid,
+            'points': points,
+            'lap_time': float(lap_time),
+            'max_speed': float(max_speed),
+            'avg_speed': float(avg_speed),
+            'is_complete': bool(is_complete),
+            'was_invalid': bool(was_invalid),
         })
 
         status = "COMPLETE" if is_complete else "INCOMPLETE"
         if was_invalid:
             status = "INVALID"
 
-        print(f"  Lap {lap_num:2d} | {lap_time:7.3f}s | {len(lap_df):5d} pts | "
-              f"Max: {max_speed:3.0f} km/h | Avg: {avg_speed:3.0f} km/h | {status}")
+        lap_lines.append(f"  Lap {lap_num:2d} | {lap_time:7.3f}s | {points:5d} pts | "
+                         f"Max: {max_speed:3.0f} km/h | Avg: {avg_speed:3.0f} km/h | {status}")
+
+    # One write for the whole lap table
+    print("\n".join(lap_lines))
 
     valid_complete = [l for l in lap_info if l['is_complete'] and not l['was_invalid']]
 
@@ -2850,65 +3413,151 @@ def analyze_session(session_path):
     print(f"  FASTEST VALID LAP: Lap {fastest['lap_num']} - {fastest['lap_time']:.3f}s")
     print("=" * 70)
 
-    reference_df = df[df['current_lap_num'] == fastest['lap_num']].copy()
-    reference_df = reference_df.sort_values('lap_distance').reset_index(drop=True)
+    reference_df = _sort_by_distance(grouped.get_group(fastest['lap_num']))
+    # The CSV keeps every logged column at full precision; the narrow
+    # analysis columns are only used for the Feather copy
+    full_rows = _read_lap_rows(csv_path, grouped.indices[fastest['lap_num']], fastest['lap_num'])
 
     ref_path = os.path.join(session_path, 'reference_lap.csv')
-    reference_df.to_csv(ref_path, index=False)
+    _write_reference_lap(reference_df, ref_path, csv_df=_sort_by_distance(full_rows))
     print(f"\n  Reference lap saved: {ref_path}")
 
     return df, lap_info, fastest
 
 
+PLOT_MAX_POINTS = 2000
+
+
+def _lttb(x, y, threshold=PLOT_MAX_POINTS):
+    """Largest-Triangle-Three-Buckets downsampling; returns indices of kept points."""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    a = 0
+    for b in range(threshold - 2):
+        lo, hi = edges[b], edges[b + 1]
+        nxt_lo, nxt_hi = hi, (edges[b + 2] if b + 2 < len(edges) else n)
+        avg_x = x[nxt_lo:nxt_hi].mean()
+        avg_y = y[nxt_lo:nxt_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        keep[b + 1] = a
+    return keep
+
+
+def _minmax_indices(y, n_buckets=PLOT_MAX_POINTS // 2):
+    """Min/max decimation: keep each bucket's extremes so input peaks survive."""
+    n = len(y)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+
+    y = np.asarray(y)
+    starts = np.linspace(0, n, n_buckets, endpoint=False).astype(np.int64)
+    mins = np.array([s + int(y[s:e].argmin()) for s, e in zip(starts, np.append(starts[1:], n))])
+    maxs = np.array([s + int(y[s:e].argmax()) for s, e in zip(starts, np.append(starts[1:], n))])
+    return np.unique(np.concatenate(([0, n - 1], mins, maxs)))
+
+
 def plot_session(df, lap_info, fastest_lap_num, session_path, show=True):
     """Generate visualization plots."""
     if not PLOTTING_AVAILABLE:
         print("  matplotlib not available - skipping plots")
         return
 
+    # Sort once (stable, so samples keep recording order within a lap) and
+    # resolve each lap to a contiguous row slice instead of masking per lap.
+    df_sorted = df.sort_values('current_lap_num', kind='stable')
+    lap_nums = df_sorted['current_lap_num'].to_numpy()
+    lap_keys = np.unique(lap_nums)
+    lap_starts = np.searchsorted(lap_nums, lap_keys, side='left')
+    lap_ends = np.searchsorted(lap_nums, lap_keys, side='right')
+
+    def slice_for(lap_num):
+        i = int(np.searchsorted(lap_keys, lap_num))
+        if i >= len(lap_keys) or lap_keys[i] != lap_num:
+            return df_sorted.iloc[0:0]
+        return df_sorted.iloc[lap_starts[i]:lap_ends[i]]
+
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     colors = plt.cm.tab10(np.linspace(0, 1, 10))
 
-    ax1 = axes[0, 0]
+    # Gather every clean lap once, then draw each panel as a single LineCollection
+    track_segs, speed_segs = [], []
+    track_colors, speed_colors = [], []
+    track_is_fastest, speed_is_fastest = [], []
+    legend_handles = []
+    has_position = 'pos_x' in df.columns
     for i, lap in enumerate(lap_info):
+        if not lap['is_complete'] or lap['was_invalid']:
+            continue
         lap_num = lap['lap_num']
-        lap_df = df[df['current_lap_num'] == lap_num]
+        lap_df = slice_for(lap_num)
+        color = colors[i % 10]
+        is_fastest = lap_num == fastest_lap_num
+
+        lap_dist = lap_df['lap_distance'].to_numpy()
+        lap_speed = lap_df['speed'].to_numpy()
+        keep = _lttb(lap_dist, lap_speed)
+        speed_segs.append(np.column_stack([lap_dist[keep], lap_speed[keep]]))
+        speed_colors.append(color)
+        speed_is_fastest.append(is_fastest)
+
+        if has_position:
+            pos_x = lap_df['pos_x'].to_numpy()
+            pos_z = lap_df['pos_z'].to_numpy()
+            keep = _lttb(pos_x, pos_z)
+            track_segs.append(np.column_stack([pos_x[keep], pos_z[keep]]))
+            track_colors.append(color)
+            track_is_fastest.append(is_fastest)
+            label = f"Lap {lap_num} ({lap['lap_time']:.3f}s)" + (" *" if is_fastest else "")
+            legend_handles.append(Line2D([], [], color=color, linewidth=2.5 if is_fastest else 1.5,
+                                         alpha=1.0 if is_fastest else 0.6, label=label))
+
+    def add_laps(ax, segs, seg_colors, is_fastest):
+        if not segs:
+            return
+        is_fastest = np.asarray(is_fastest)
+        rgba = np.array(seg_colors, dtype=float)
+        rgba[:, 3] = np.where(is_fastest, 1.0, 0.6)
+        ax.add_collection(LineCollection(segs, colors=rgba, linewidths=np.where(is_fastest, 2.5, 1.5)))
+        ax.autoscale_view()
 
-        if lap['is_complete'] and not lap['was_invalid'] and 'pos_x' in lap_df.columns:
-            lw = 2.5 if lap_num == fastest_lap_num else 1.5
-            alpha = 1.0 if lap_num == fastest_lap_num else 0.6
-            label = f"Lap {lap_num} ({lap['lap_time']:.3f}s)" + (" *" if lap_num == fastest_lap_num else "")
-            ax1.plot(lap_df['pos_x'], lap_df['pos_z'], color=colors[i % 10], linewidth=lw, alpha=alpha, label=label)
+    ax1 = axes[0, 0]
+    add_laps(ax1, track_segs, track_colors, track_is_fastest)
 
     ax1.set_xlabel('X Position (m)')
     ax1.set_ylabel('Z Position (m)')
     ax1.set_title('Track Map')
-    ax1.legend(loc='best', fontsize=8)
+    ax1.legend(handles=legend_handles, loc='best', fontsize=8)
     ax1.grid(True, alpha=0.3)
     ax1.set_aspect('equal')
 
     ax2 = axes[0, 1]
-    for i, lap in enumerate(lap_info):
-        lap_num = lap['lap_num']
-        lap_df = df[df['current_lap_num'] == lap_num]
-
-        if lap['is_complete'] and not lap['was_invalid']:
-            lw = 2.5 if lap_num == fastest_lap_num else 1.5
-            alpha = 1.0 if lap_num == fastest_lap_num else 0.6
-            ax2.plot(lap_df['lap_distance'], lap_df['speed'], color=colors[i % 10], linewidth=lw, alpha=alpha)
+    add_laps(ax2, speed_segs, speed_colors, speed_is_fastest)
 
     ax2.set_xlabel('Lap Distance (m)')
     ax2.set_ylabel('Speed (km/h)')
     ax2.set_title('Speed Trace')
     ax2.grid(True, alpha=0.3)
 
+    fastest_df = slice_for(fastest_lap_num) if fastest_lap_num else None
+
     ax3 = axes[1, 0]
     if fastest_lap_num:
-        fastest_df = df[df['current_lap_num'] == fastest_lap_num]
-        ax3.plot(fastest_df['lap_distance'], fastest_df['throttle'], 'g-', lw=1.5, label='Throttle')
-        ax3.plot(fastest_df['lap_distance'], fastest_df['brake'], 'r-', lw=1.5, label='Brake')
-        ax3.fill_between(fastest_df['lap_distance'], 0, fastest_df['throttle'], color='green', alpha=0.3)
-        ax3.fill_between(fastest_df['lap_distance'], 0, fastest_df['brake'], color='red', alpha=0.3)
+        dist = fastest_df['lap_distance'].to_numpy()
+        for column, style, color, label in (('throttle', 'g-', 'green', 'Throttle'), ('brake', 'r-', 'red', 'Brake')):
+            values = fastest_df[column].to_numpy()
+            keep = _minmax_indices(values)
+            ax3.plot(dist[keep], values[keep], style, lw=1.5, label=label)
+            ax3.fill_between(dist[keep], 0, values[keep], color=color, alpha=0.3)
     ax3.set_xlabel('Lap Distance (m)')
     ax3.set_ylabel('Input (0-1)')
     ax3.set_title(f'Throttle & Brake - Lap {fastest_lap_num}')
@@ -2918,23 +3567,25 @@ def plot_session(df, lap_info, fastest_lap_num, session_path, show=True):
 
     ax4 = axes[1, 1]
     if fastest_lap_num:
-        fastest_df = df[df['current_lap_num'] == fastest_lap_num]
-        ax4.plot(fastest_df['lap_distance'], fastest_df['gear'], 'b-', lw=2)
-        ax4.fill_between(fastest_df['lap_distance'], 0, fastest_df['gear'], color='blue', alpha=0.3)
+        dist = fastest_df['lap_distance'].to_numpy()
+        gears = fastest_df['gear'].to_numpy()
+        keep = _minmax_indices(gears)
+        ax4.plot(dist[keep], gears[keep], 'b-', lw=2)
+        ax4.fill_between(dist[keep], 0, gears[keep], color='blue', alpha=0.3)
     ax4.set_xlabel('Lap Distance (m)')
     ax4.set_ylabel('Gear')
     ax4.set_title(f'Gear Selection - Lap {fastest_lap_num}')
     ax4.grid(True, alpha=0.3)
     ax4.set_ylim(0, 9)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     output_file = os.path.join(session_path, 'analysis.png')
-    plt.savefig(output_file, dpi=150, bbox_inches='tight')
+    fig.savefig(output_file, dpi=150, bbox_inches='tight')
     print(f"\n  Plot saved: {output_file}")
-    if show:
+    if show and matplotlib.get_backend().lower() != 'agg':
         plt.show()
-    plt.close()
+    plt.close(fig)
     return output_file
 
 
@@ -2978,6 +3629,9 @@ def select_session():
     print("  " + "-" * 50)
     print("  0. Cancel")
 
+    # The newest session is the usual pick; parse it while the prompt waits
+    _prefetch_analysis_frame(sessions[-1]['csv_path'])
+
     try:
         choice = input("\n  Select session: ").strip()
         if choice == '0' or choice == '':
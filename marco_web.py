@@ -14,7 +14,7 @@ try:
 except ImportError:
     WEB_AVAILABLE = False
 
-from marco_core import SessionManager, shared_state, analyze_session, plot_session
+from marco_core import SessionManager, shared_state, analyze_session, plot_session, read_reference_lap
 
 WEB_PORT = 5000
 
@@ -216,7 +216,7 @@ class WebServer:
                 track_outline: list = []
                 heatmap: list = []
                 if os.path.exists(ref_path):
-                    ref = pd.read_csv(ref_path)
+                    ref = read_reference_lap(ref_path)
                     step = max(1, len(ref) // 3000)
                     s = ref.iloc[::step].copy()
                     for col in ('speed', 'throttle', 'brake', 'pos_x', 'pos_z'):